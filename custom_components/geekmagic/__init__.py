@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from typing import TYPE_CHECKING, Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
@@ -12,27 +15,28 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
-from .coordinator import GeekMagicCoordinator
-from .device import GeekMagicDevice
-from .panel import async_register_panel
-from .store import GeekMagicStore
-from .websocket import async_register_websocket_commands
+from .const import CONF_MODEL, DOMAIN, MODEL_UNKNOWN
+
+if TYPE_CHECKING:
+    from .coordinator import GeekMagicCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# hass.data key for the shared domain setup task (see async_setup_entry)
+DATA_SETUP_TASK = f"{DOMAIN}_setup_task"
+
 # Schema for integrations configured via UI only (no YAML support)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 # Platforms for device control entities and image output
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.IMAGE,
     Platform.NUMBER,
     Platform.SELECT,
     Platform.SENSOR,
     Platform.BUTTON,
     Platform.SWITCH,
-]
+)
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -48,22 +52,33 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     Returns:
         True if setup successful
     """
+    # Deferred so loading the package (e.g. for the config flow) doesn't pull
+    # in the renderer, Pillow and the websocket API before they are needed
+    from .panel import async_register_panel
+    from .store import GeekMagicStore
+    from .websocket import async_register_websocket_commands
+
     _LOGGER.debug("Setting up GeekMagic domain")
 
-    # Initialize domain data
-    hass.data.setdefault(DOMAIN, {})
+    # Initialize domain data, namespaced so coordinators never mix with globals:
+    #   "entries":             config entry id -> coordinator
+    #   "device_coordinators": device registry id -> coordinator (lookup cache)
+    #   "store":               global view store
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    entries: dict[str, GeekMagicCoordinator] = domain_data.setdefault("entries", {})
+    device_coordinators: dict[str, GeekMagicCoordinator] = domain_data.setdefault(
+        "device_coordinators", {}
+    )
 
-    # Initialize global store for views
+    # Load the global view store and register the custom panel concurrently;
+    # both do disk I/O and the panel doesn't depend on the store contents
     store = GeekMagicStore(hass)
-    await store.async_load()
-    hass.data[DOMAIN]["store"] = store
+    await asyncio.gather(store.async_load(), async_register_panel(hass))
+    domain_data["store"] = store
 
     # Register WebSocket commands
     async_register_websocket_commands(hass)
 
-    # Register custom panel
-    await async_register_panel(hass)
-
     # Register notify service
     async def async_handle_notify(call):
         """Handle the notify service call."""
@@ -71,20 +86,30 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         if not isinstance(device_ids, list):
             device_ids = [device_ids]
 
-        # Get device registry to map device_ids to config entries
         dev_reg = dr.async_get(hass)
-
+        coordinators: list[GeekMagicCoordinator] = []
         for device_id in device_ids:
-            device = dev_reg.async_get(device_id)
-            if not device:
-                continue
-
-            # Find config entry for this device
-            for entry_id in device.config_entries:
-                if entry_id in hass.data[DOMAIN]:
-                    coordinator = hass.data[DOMAIN][entry_id]
-                    if isinstance(coordinator, GeekMagicCoordinator):
-                        await coordinator.trigger_notification(call.data)
+            coordinator = device_coordinators.get(device_id)
+            if coordinator is None and (device := dev_reg.async_get(device_id)):
+                # Devices registered by platforms (e.g. the preview image) are
+                # resolved through the registry once, then cached
+                for entry_id in device.config_entries & entries.keys():
+                    coordinator = device_coordinators[device_id] = entries[entry_id]
+                    break
+            if coordinator is not None:
+                coordinators.append(coordinator)
+
+        # Each coordinator talks to its own device, so fan out concurrently and
+        # keep one unreachable display from failing the whole call
+        results = await asyncio.gather(
+            *(coordinator.trigger_notification(call.data) for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        for coordinator, result in zip(coordinators, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Failed to send notification to %s: %s", coordinator.device_name, result
+                )
 
     hass.services.async_register(DOMAIN, "notify", async_handle_notify)
 
@@ -102,34 +127,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         True if setup successful
     """
-    # Ensure domain is set up
-    if DOMAIN not in hass.data:
-        await async_setup(hass, {})
+    # Ensure domain is set up. Entries set up concurrently all await the same
+    # task, so async_setup runs once and nobody proceeds before the store loads.
+    setup_task: asyncio.Task[bool] | None = hass.data.get(DATA_SETUP_TASK)
+    if setup_task is None and DOMAIN not in hass.data:
+        setup_task = hass.async_create_task(async_setup(hass, {}))
+        hass.data[DATA_SETUP_TASK] = setup_task
+    if setup_task is not None:
+        try:
+            await setup_task
+        except Exception:
+            # Forget the failed setup (and its partial domain data) so the next
+            # entry setup retry runs async_setup again instead of re-raising
+            if hass.data.get(DATA_SETUP_TASK) is setup_task:
+                hass.data.pop(DATA_SETUP_TASK)
+                if "store" not in hass.data.get(DOMAIN, {}):
+                    hass.data.pop(DOMAIN, None)
+            raise
+
+    from .coordinator import GeekMagicCoordinator
+    from .device import GeekMagicDevice
 
     host = entry.data[CONF_HOST]
     _LOGGER.debug("Setting up GeekMagic integration for %s", host)
+    setup_start = time.monotonic()
 
     session = async_get_clientsession(hass)
-    device = GeekMagicDevice(host, session=session)
-
-    # Test connection - raise ConfigEntryNotReady if device is offline
+    stored_model = entry.data.get(CONF_MODEL, MODEL_UNKNOWN)
+    device = GeekMagicDevice(host, session=session, model=stored_model)
+
+    # Test connection and detect device model (Pro vs Ultra) concurrently.
+    # Both are independent requests; detect_model() never raises, falls
+    # back to MODEL_UNKNOWN if the device is unreachable, and does not probe
+    # again once the model is stored in the entry.
+    result, model = await asyncio.gather(device.test_connection(), device.detect_model())
+    if model not in (MODEL_UNKNOWN, stored_model):
+        hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_MODEL: model})
+
+    # Raise ConfigEntryNotReady if device is offline
     # This allows HA to automatically retry instead of showing a "Setup Error"
-    result = await device.test_connection()
     if not result:
         raise ConfigEntryNotReady(
             f"Could not connect to GeekMagic device at {host}: {result.message}"
         )
 
-    _LOGGER.debug("Successfully connected to GeekMagic device at %s", host)
-
-    # Detect device model (Pro vs Ultra)
-    await device.detect_model()
+    _LOGGER.debug(
+        "Successfully connected to GeekMagic device at %s (%.2fs)",
+        host,
+        time.monotonic() - setup_start,
+    )
 
     # Create coordinator
     coordinator = GeekMagicCoordinator(
         hass=hass,
         device=device,
-        options=dict(entry.options),
+        options=entry.options,
         config_entry=entry,
     )
 
@@ -138,16 +190,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data.setdefault("entries", {})[entry.entry_id] = coordinator
+
+    # Register the device up front so the notify service can map
+    # device_id -> coordinator with a single dict lookup
+    device_entry = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, entry.entry_id)},
+        manufacturer="GeekMagic",
+        name=entry.title,
+    )
+    domain_data.setdefault("device_coordinators", {})[device_entry.id] = coordinator
 
     # Set up options update listener
     entry.async_on_unload(entry.add_update_listener(async_options_update_listener))
+    # Stop the coordinator's entity state tracking when the entry unloads
+    entry.async_on_unload(coordinator.async_shutdown)
 
-    # Set up platforms
+    # Set up platforms (HA sets up all platforms concurrently; this must be
+    # awaited here since forwarding is only allowed while the entry is loading)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    _LOGGER.info("GeekMagic integration successfully set up for %s", host)
+    _LOGGER.info(
+        "GeekMagic integration successfully set up for %s in %.2fs",
+        host,
+        time.monotonic() - setup_start,
+    )
     return True
 
 
@@ -167,9 +236,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    # Remove coordinator
-    if unload_ok and entry.entry_id in hass.data.get(DOMAIN, {}):
-        del hass.data[DOMAIN][entry.entry_id]
+    # Remove coordinator and any cached device lookups pointing at it
+    domain_data = hass.data.get(DOMAIN, {})
+    entries = domain_data.get("entries", {})
+    if unload_ok and entry.entry_id in entries:
+        coordinator = entries.pop(entry.entry_id)
+        device_coordinators = domain_data.get("device_coordinators", {})
+        for device_id in [d for d, c in device_coordinators.items() if c is coordinator]:
+            del device_coordinators[device_id]
         _LOGGER.debug("GeekMagic integration unloaded for %s", host)
 
     return unload_ok
@@ -184,8 +258,8 @@ async def async_options_update_listener(hass: HomeAssistant, entry: ConfigEntry)
     """
     host = entry.data.get(CONF_HOST, "unknown")
     _LOGGER.debug("Options updated for GeekMagic device %s", host)
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
-    coordinator.update_options(dict(entry.options))
+    coordinator: GeekMagicCoordinator = hass.data[DOMAIN]["entries"][entry.entry_id]
+    coordinator.update_options(entry.options)
     # Trigger immediate refresh so device displays updated config
     await coordinator.async_request_refresh()
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -33,6 +35,10 @@ from .device import GeekMagicDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Re-submitting the form for a host that just failed reuses that result
+# instead of probing the device again (e.g. double-clicked submit)
+FAILED_CONNECTION_REUSE_SECONDS = 5.0
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -40,6 +46,46 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Single source of truth for new-device and reset-to-defaults options.
+# Never hand this out directly; use _default_options() for a private copy.
+_DEFAULT_OPTIONS_TEMPLATE: dict[str, Any] = {
+    CONF_REFRESH_INTERVAL: DEFAULT_REFRESH_INTERVAL,
+    CONF_SCREEN_CYCLE_INTERVAL: DEFAULT_SCREEN_CYCLE_INTERVAL,
+    CONF_JPEG_QUALITY: DEFAULT_JPEG_QUALITY,
+    CONF_DISPLAY_ROTATION: DEFAULT_DISPLAY_ROTATION,
+    CONF_SCREENS: [
+        {
+            "name": "Screen 1",
+            CONF_LAYOUT: LAYOUT_GRID_2X2,
+            CONF_SCREEN_THEME: THEME_CLASSIC,
+            CONF_WIDGETS: [{"type": "clock", "slot": 0}],
+        }
+    ],
+}
+
+
+def _default_options() -> dict[str, Any]:
+    """Return a fresh, mutable copy of the default options."""
+    return copy.deepcopy(_DEFAULT_OPTIONS_TEMPLATE)
+
+
+# Options flow menu actions (action key -> label)
+_OPTIONS_ACTIONS = {
+    "reset_defaults": "Reset to Default Configuration",
+}
+
+_OPTIONS_INIT_SCHEMA = vol.Schema(
+    {
+        vol.Required("action"): vol.In(_OPTIONS_ACTIONS),
+    }
+)
+
+_RESET_CONFIRM_SCHEMA = vol.Schema(
+    {
+        vol.Required("confirm", default=False): bool,
+    }
+)
+
 
 class GeekMagicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for GeekMagic.
@@ -50,6 +96,11 @@ class GeekMagicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        # (normalized host, monotonic time, error key) of the last failed probe
+        self._last_failure: tuple[str, float, str] | None = None
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Handle the initial step - device connection."""
         errors: dict[str, str] = {}
@@ -59,25 +110,36 @@ class GeekMagicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.debug("Config flow: attempting to configure device at %s", host)
 
             # Check if already configured (use normalized host for uniqueness)
-            session = async_get_clientsession(self.hass)
-            device = GeekMagicDevice(host, session=session)
-            await self.async_set_unique_id(device.host)
+            # before touching the network, so duplicates abort immediately
+            normalized_host = GeekMagicDevice.normalize_host(host)
+            await self.async_set_unique_id(normalized_host)
             self._abort_if_unique_id_configured()
 
-            # Test connection
-            result = await device.test_connection()
-
-            if result.success:
-                _LOGGER.info("Config flow: successfully connected to %s", host)
-
-                # Create entry with default options
-                return self.async_create_entry(
-                    title=user_input.get(CONF_NAME, f"GeekMagic ({device.host})"),
-                    data=user_input,
-                    options=self._get_default_options(),
-                )
-            _LOGGER.warning("Config flow: failed to connect to %s: %s", host, result.message)
-            errors["base"] = result.error
+            last_failure = self._last_failure
+            if (
+                last_failure is not None
+                and last_failure[0] == normalized_host
+                and time.monotonic() - last_failure[1] < FAILED_CONNECTION_REUSE_SECONDS
+            ):
+                errors["base"] = last_failure[2]
+            else:
+                # Test connection
+                session = async_get_clientsession(self.hass)
+                device = GeekMagicDevice(host, session=session)
+                result = await device.test_connection()
+
+                if result.success:
+                    _LOGGER.info("Config flow: successfully connected to %s", host)
+
+                    # Create entry with default options
+                    return self.async_create_entry(
+                        title=user_input.get(CONF_NAME, f"GeekMagic ({device.host})"),
+                        data=user_input,
+                        options=self._get_default_options(),
+                    )
+                _LOGGER.warning("Config flow: failed to connect to %s: %s", host, result.message)
+                errors["base"] = result.error
+                self._last_failure = (normalized_host, time.monotonic(), result.error)
 
         return self.async_show_form(
             step_id="user",
@@ -87,20 +149,7 @@ class GeekMagicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def _get_default_options(self) -> dict[str, Any]:
         """Get default options for a new device."""
-        return {
-            CONF_REFRESH_INTERVAL: DEFAULT_REFRESH_INTERVAL,
-            CONF_SCREEN_CYCLE_INTERVAL: DEFAULT_SCREEN_CYCLE_INTERVAL,
-            CONF_JPEG_QUALITY: DEFAULT_JPEG_QUALITY,
-            CONF_DISPLAY_ROTATION: DEFAULT_DISPLAY_ROTATION,
-            CONF_SCREENS: [
-                {
-                    "name": "Screen 1",
-                    CONF_LAYOUT: LAYOUT_GRID_2X2,
-                    CONF_SCREEN_THEME: THEME_CLASSIC,
-                    CONF_WIDGETS: [{"type": "clock", "slot": 0}],
-                }
-            ],
-        }
+        return _default_options()
 
     @staticmethod
     @callback
@@ -122,21 +171,15 @@ class GeekMagicOptionsFlow(config_entries.OptionsFlow):
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Show options menu."""
         if user_input is not None:
-            action = user_input.get("action")
-            if action == "reset_defaults":
-                return await self.async_step_reset_defaults()
+            # "action" is vol.Required and restricted to _OPTIONS_ACTIONS by the schema
+            action_steps = {
+                "reset_defaults": self.async_step_reset_defaults,
+            }
+            return await action_steps[user_input["action"]]()
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("action"): vol.In(
-                        {
-                            "reset_defaults": "Reset to Default Configuration",
-                        }
-                    )
-                }
-            ),
+            data_schema=_OPTIONS_INIT_SCHEMA,
             description_placeholders={
                 "tip": "Tip: Configure your display using the device entities "
                 "(brightness, screens, widgets, etc.) on the device page."
@@ -148,31 +191,15 @@ class GeekMagicOptionsFlow(config_entries.OptionsFlow):
     ) -> ConfigFlowResult:
         """Reset to default configuration."""
         if user_input is not None:
-            if user_input.get("confirm"):
+            if user_input["confirm"]:
                 # Reset to defaults
-                default_options = {
-                    CONF_REFRESH_INTERVAL: DEFAULT_REFRESH_INTERVAL,
-                    CONF_SCREEN_CYCLE_INTERVAL: DEFAULT_SCREEN_CYCLE_INTERVAL,
-                    CONF_SCREENS: [
-                        {
-                            "name": "Screen 1",
-                            CONF_LAYOUT: LAYOUT_GRID_2X2,
-                            CONF_SCREEN_THEME: THEME_CLASSIC,
-                            CONF_WIDGETS: [{"type": "clock", "slot": 0}],
-                        }
-                    ],
-                }
-                return self.async_create_entry(title="", data=default_options)
+                return self.async_create_entry(title="", data=_default_options())
             # User cancelled
             return await self.async_step_init()
 
         return self.async_show_form(
             step_id="reset_defaults",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("confirm", default=False): bool,
-                }
-            ),
+            data_schema=_RESET_CONFIRM_SCHEMA,
             description_placeholders={
                 "warning": "This will reset all screens and widgets to defaults. "
                 "Your current configuration will be lost."
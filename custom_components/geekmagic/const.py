@@ -1,5 +1,7 @@
 """Constants for GeekMagic integration."""
 
+from types import MappingProxyType
+
 DOMAIN = "geekmagic"
 
 # Device models
@@ -22,10 +24,12 @@ MAX_BACKOFF_MULTIPLIER = 16  # Max 160s (~2.7 min) between retries (10s * 2^4)
 BACKOFF_LOG_INTERVAL = 30  # Log summary every 30 failures (~5 min at max backoff)
 DEFAULT_DISPLAY_ROTATION = 0  # No rotation
 MAX_IMAGE_SIZE = 400 * 1024  # 400KB max size for device uploads
+MAX_IMAGE_DOWNLOAD_SIZE = 4 * 1024 * 1024  # 4MB max size for fetched pictures/album art
 
 # Config keys
 CONF_HOST = "host"
 CONF_NAME = "name"
+CONF_MODEL = "model"  # Detected device model, stored in the entry data
 CONF_REFRESH_INTERVAL = "refresh_interval"
 CONF_JPEG_QUALITY = "jpeg_quality"
 CONF_DISPLAY_ROTATION = "display_rotation"
@@ -52,19 +56,21 @@ THEME_SUNSET = "sunset"
 THEME_FOREST = "forest"
 THEME_CANDY = "candy"
 
-# Theme display names for UI
-THEME_OPTIONS = {
-    THEME_CLASSIC: "Classic",
-    THEME_MINIMAL: "Minimal",
-    THEME_NEON: "Neon",
-    THEME_RETRO: "Retro",
-    THEME_SOFT: "Soft",
-    THEME_LIGHT: "Light",
-    THEME_OCEAN: "Ocean",
-    THEME_SUNSET: "Sunset",
-    THEME_FOREST: "Forest",
-    THEME_CANDY: "Candy",
-}
+# Theme display names for UI (read-only)
+THEME_OPTIONS = MappingProxyType(
+    {
+        THEME_CLASSIC: "Classic",
+        THEME_MINIMAL: "Minimal",
+        THEME_NEON: "Neon",
+        THEME_RETRO: "Retro",
+        THEME_SOFT: "Soft",
+        THEME_LIGHT: "Light",
+        THEME_OCEAN: "Ocean",
+        THEME_SUNSET: "Sunset",
+        THEME_FOREST: "Forest",
+        THEME_CANDY: "Candy",
+    }
+)
 
 # Layout types
 LAYOUT_GRID_2X2 = "grid_2x2"
@@ -101,44 +107,49 @@ WIDGET_STATUS = "status"
 WIDGET_STATUS_LIST = "status_list"
 WIDGET_WEATHER = "weather"
 
-# Layout slot counts
-LAYOUT_SLOT_COUNTS = {
-    LAYOUT_GRID_2X2: 4,
-    LAYOUT_GRID_2X3: 6,
-    LAYOUT_GRID_3X2: 6,
-    LAYOUT_GRID_3X3: 9,
-    LAYOUT_HERO: 4,
-    LAYOUT_SPLIT_H: 2,
-    LAYOUT_SPLIT_V: 2,
-    LAYOUT_THREE_COLUMN: 3,
-    LAYOUT_THREE_ROW: 3,
-    LAYOUT_SPLIT_H_1_2: 2,
-    LAYOUT_SPLIT_H_2_1: 2,
-    LAYOUT_SIDEBAR_LEFT: 4,
-    LAYOUT_SIDEBAR_RIGHT: 4,
-    LAYOUT_HERO_TL: 6,
-    LAYOUT_HERO_TR: 6,
-    LAYOUT_HERO_BL: 6,
-    LAYOUT_HERO_BR: 6,
-    LAYOUT_HERO_SIMPLE: 2,
-    LAYOUT_FULLSCREEN: 1,
-}
-
-# Widget type display names for UI
-WIDGET_TYPE_NAMES = {
-    WIDGET_CAMERA: "Camera",
-    WIDGET_CLOCK: "Clock",
-    WIDGET_ENTITY: "Entity",
-    WIDGET_MEDIA: "Media Player",
-    WIDGET_CHART: "Chart",
-    WIDGET_TEXT: "Text",
-    WIDGET_GAUGE: "Gauge",
-    WIDGET_PROGRESS: "Progress",
-    WIDGET_MULTI_PROGRESS: "Multi Progress",
-    WIDGET_STATUS: "Status",
-    WIDGET_STATUS_LIST: "Status List",
-    WIDGET_WEATHER: "Weather",
-}
+# Layout slot counts (read-only)
+LAYOUT_SLOT_COUNTS = MappingProxyType(
+    {
+        LAYOUT_GRID_2X2: 4,
+        LAYOUT_GRID_2X3: 6,
+        LAYOUT_GRID_3X2: 6,
+        LAYOUT_GRID_3X3: 9,
+        LAYOUT_HERO: 4,
+        LAYOUT_SPLIT_H: 2,
+        LAYOUT_SPLIT_V: 2,
+        LAYOUT_THREE_COLUMN: 3,
+        LAYOUT_THREE_ROW: 3,
+        LAYOUT_SPLIT_H_1_2: 2,
+        LAYOUT_SPLIT_H_2_1: 2,
+        LAYOUT_SIDEBAR_LEFT: 4,
+        LAYOUT_SIDEBAR_RIGHT: 4,
+        LAYOUT_HERO_TL: 6,
+        LAYOUT_HERO_TR: 6,
+        LAYOUT_HERO_BL: 6,
+        LAYOUT_HERO_BR: 6,
+        LAYOUT_HERO_SIMPLE: 2,
+        LAYOUT_FULLSCREEN: 1,
+    }
+)
+
+
+# Widget type display names for UI (read-only)
+WIDGET_TYPE_NAMES = MappingProxyType(
+    {
+        WIDGET_CAMERA: "Camera",
+        WIDGET_CLOCK: "Clock",
+        WIDGET_ENTITY: "Entity",
+        WIDGET_MEDIA: "Media Player",
+        WIDGET_CHART: "Chart",
+        WIDGET_TEXT: "Text",
+        WIDGET_GAUGE: "Gauge",
+        WIDGET_PROGRESS: "Progress",
+        WIDGET_MULTI_PROGRESS: "Multi Progress",
+        WIDGET_STATUS: "Status",
+        WIDGET_STATUS_LIST: "Status List",
+        WIDGET_WEATHER: "Weather",
+    }
+)
 
 # Colors (RGB tuples) - Using palettable Bold and Dark2 palettes
 # These are colorblind-friendly and professionally curated
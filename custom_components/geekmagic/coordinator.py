@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
+from zoneinfo import ZoneInfo
 
 if TYPE_CHECKING:
-    import asyncio
+    from collections.abc import Callable, Mapping, Sequence
+
+    import aiohttp
 
 from homeassistant.const import __version__ as ha_version
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -56,6 +64,7 @@ from .const import (
     LAYOUT_THREE_COLUMN,
     LAYOUT_THREE_ROW,
     MAX_BACKOFF_MULTIPLIER,
+    MAX_IMAGE_DOWNLOAD_SIZE,
     MODEL_PRO,
     THEME_CLASSIC,
 )
@@ -74,7 +83,7 @@ from .layouts.split import (
     ThreeColumnLayout,
     ThreeRowLayout,
 )
-from .renderer import Renderer
+from .renderer import SUPERSAMPLE_SCALE, Renderer
 from .widgets.attribute_list import AttributeListWidget
 from .widgets.base import WidgetConfig
 from .widgets.camera import CameraWidget
@@ -93,53 +102,63 @@ from .widgets.theme import get_theme
 from .widgets.weather import WeatherWidget
 
 if TYPE_CHECKING:
+    from homeassistant.components.recorder import Recorder
+    from PIL import Image
+
     from .layouts.base import Layout
     from .store import GeekMagicStore
+    from .widgets.base import Widget
 
 _LOGGER = logging.getLogger(__name__)
 
 # Config key for new global views format
 CONF_ASSIGNED_VIEWS = "assigned_views"
 
-LAYOUT_CLASSES = {
-    LAYOUT_GRID_2X2: Grid2x2,
-    LAYOUT_GRID_2X3: Grid2x3,
-    LAYOUT_GRID_3X2: Grid3x2,
-    LAYOUT_GRID_3X3: Grid3x3,
-    LAYOUT_HERO: HeroLayout,
-    LAYOUT_HERO_SIMPLE: HeroSimpleLayout,
-    LAYOUT_SPLIT_H: SplitHorizontal,
-    LAYOUT_SPLIT_H_1_2: SplitHorizontal1To2,
-    LAYOUT_SPLIT_H_2_1: SplitHorizontal2To1,
-    LAYOUT_SPLIT_V: SplitVertical,
-    LAYOUT_THREE_COLUMN: ThreeColumnLayout,
-    LAYOUT_THREE_ROW: ThreeRowLayout,
-    LAYOUT_SIDEBAR_LEFT: SidebarLeft,
-    LAYOUT_SIDEBAR_RIGHT: SidebarRight,
-    LAYOUT_HERO_TL: HeroCornerTL,
-    LAYOUT_HERO_TR: HeroCornerTR,
-    LAYOUT_HERO_BL: HeroCornerBL,
-    LAYOUT_HERO_BR: HeroCornerBR,
-    LAYOUT_FULLSCREEN: FullscreenLayout,
-}
+# Layout type -> layout class (read-only)
+LAYOUT_CLASSES = MappingProxyType(
+    {
+        LAYOUT_GRID_2X2: Grid2x2,
+        LAYOUT_GRID_2X3: Grid2x3,
+        LAYOUT_GRID_3X2: Grid3x2,
+        LAYOUT_GRID_3X3: Grid3x3,
+        LAYOUT_HERO: HeroLayout,
+        LAYOUT_HERO_SIMPLE: HeroSimpleLayout,
+        LAYOUT_SPLIT_H: SplitHorizontal,
+        LAYOUT_SPLIT_H_1_2: SplitHorizontal1To2,
+        LAYOUT_SPLIT_H_2_1: SplitHorizontal2To1,
+        LAYOUT_SPLIT_V: SplitVertical,
+        LAYOUT_THREE_COLUMN: ThreeColumnLayout,
+        LAYOUT_THREE_ROW: ThreeRowLayout,
+        LAYOUT_SIDEBAR_LEFT: SidebarLeft,
+        LAYOUT_SIDEBAR_RIGHT: SidebarRight,
+        LAYOUT_HERO_TL: HeroCornerTL,
+        LAYOUT_HERO_TR: HeroCornerTR,
+        LAYOUT_HERO_BL: HeroCornerBL,
+        LAYOUT_HERO_BR: HeroCornerBR,
+        LAYOUT_FULLSCREEN: FullscreenLayout,
+    }
+)
 
-WIDGET_CLASSES = {
-    "attribute_list": AttributeListWidget,
-    "camera": CameraWidget,
-    "climate": ClimateWidget,
-    "clock": ClockWidget,
-    "entity": EntityWidget,
-    "media": MediaWidget,
-    "chart": ChartWidget,
-    "text": TextWidget,
-    "gauge": GaugeWidget,
-    "progress": ProgressWidget,
-    "multi_progress": MultiProgressWidget,
-    "status": StatusWidget,
-    "status_list": StatusListWidget,
-    "weather": WeatherWidget,
-    "icon": IconWidget,
-}
+# Widget type -> widget class (read-only)
+WIDGET_CLASSES = MappingProxyType(
+    {
+        "attribute_list": AttributeListWidget,
+        "camera": CameraWidget,
+        "climate": ClimateWidget,
+        "clock": ClockWidget,
+        "entity": EntityWidget,
+        "media": MediaWidget,
+        "chart": ChartWidget,
+        "text": TextWidget,
+        "gauge": GaugeWidget,
+        "progress": ProgressWidget,
+        "multi_progress": MultiProgressWidget,
+        "status": StatusWidget,
+        "status_list": StatusListWidget,
+        "weather": WeatherWidget,
+        "icon": IconWidget,
+    }
+)
 
 
 # Binary states that should be converted to 1.0 (on/true)
@@ -148,6 +167,51 @@ BINARY_ON_STATES = frozenset({"on", "true", "open", "home", "unlocked", "playing
 BINARY_OFF_STATES = frozenset(
     {"off", "false", "closed", "not_home", "locked", "paused", "idle", "standby"}
 )
+# Lowercase binary state -> chart value
+BINARY_STATE_VALUES: dict[str, float] = {
+    **dict.fromkeys(BINARY_ON_STATES, 1.0),
+    **dict.fromkeys(BINARY_OFF_STATES, 0.0),
+}
+
+# Number of rendered frames kept for reuse when nothing on screen changed
+RENDER_CACHE_SIZE = 8
+# Number of decoded camera/album art images kept across refreshes
+DECODED_IMAGE_CACHE_SIZE = 16
+# Number of downloaded camera images and album art kept per image cache
+IMAGE_CACHE_SIZE = 32
+# Seconds after which an unchanged frame is uploaded again anyway, so a device
+# that restarted or was switched away from the custom image is repainted
+UNCHANGED_UPLOAD_INTERVAL = 300
+# Seconds a frame upload may take before the refresh gives up on it, so one
+# slow device cannot stretch the refresh cycle
+UPLOAD_TIMEOUT = 10
+
+# Widgets whose output changes without an entity state change (time, playback
+# position, pre-fetched images/history/forecasts); screens with these always render
+LIVE_WIDGET_TYPES = (ClockWidget, MediaWidget, CameraWidget, ChartWidget, WeatherWidget)
+# Widgets whose data is pre-fetched before rendering
+PREFETCH_WIDGET_TYPES = (CameraWidget, MediaWidget, ChartWidget, WeatherWidget)
+
+# Clock widget timezones resolved so far (timezone name -> ZoneInfo)
+_ZONEINFO_CACHE: dict[str, ZoneInfo] = {}
+
+
+def _freeze_options(value: Any) -> Any:
+    """Convert widget options into a hashable equivalent for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_options(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze_options(item) for item in value)
+    return value
+
+
+def _history_state_value(state: Any) -> Any:
+    """Get the raw state value from a State object or minimal_response dict."""
+    # Intermediate minimal_response points are plain dicts and make up most of
+    # the history, so test for them first instead of probing for .state
+    if type(state) is dict:
+        return state.get("state")
+    return getattr(state, "state", None)
 
 
 def extract_numeric_values(history_states: list) -> list[float]:
@@ -165,26 +229,28 @@ def extract_numeric_values(history_states: list) -> list[float]:
     Returns:
         List of numeric float values, non-numeric states are skipped
     """
+    raw_values = [
+        value for state in history_states if (value := _history_state_value(state)) is not None
+    ]
+
+    # Fast path: purely numeric history (the common sensor case) converts in
+    # one comprehension without per-point exception handling
+    try:
+        return [float(value) for value in raw_values]
+    except (ValueError, TypeError):
+        pass
+
     values: list[float] = []
-    for state in history_states:
+    for value in raw_values:
+        # Check binary states first so on/off histories never raise
+        binary = BINARY_STATE_VALUES.get(str(value).lower())
+        if binary is not None:
+            values.append(binary)
+            continue
         try:
-            # Handle both State objects and minimal_response dicts
-            state_value = state.state if hasattr(state, "state") else state.get("state")
-            if state_value is None:
-                continue
-
-            # Try numeric conversion first
-            try:
-                values.append(float(state_value))
-            except (ValueError, TypeError):
-                # Check for binary states
-                state_lower = str(state_value).lower()
-                if state_lower in BINARY_ON_STATES:
-                    values.append(1.0)
-                elif state_lower in BINARY_OFF_STATES:
-                    values.append(0.0)
-                # Skip other non-numeric states (unavailable, unknown, etc.)
-        except AttributeError:
+            values.append(float(value))
+        except (ValueError, TypeError):
+            # Skip other non-numeric states (unavailable, unknown, etc.)
             continue
     return values
 
@@ -196,7 +262,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         device: GeekMagicDevice,
-        options: dict[str, Any],
+        options: Mapping[str, Any],
         config_entry: Any = None,
     ) -> None:
         """Initialize the coordinator.
@@ -204,25 +270,57 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         Args:
             hass: Home Assistant instance
             device: GeekMagic device client
-            options: Integration options
+            options: Integration options (read-only mapping, not copied)
             config_entry: Config entry reference for entity registration
         """
         self.device = device
-        self.options = self._migrate_options(options)
+        self._apply_options(options)
         self.renderer = Renderer()
         self._layouts: list = []  # List of layouts for each screen
         self._current_screen: int = 0
-        self._last_screen_change: float = time.time()
+        # Intervals and deadlines use the monotonic clock; _tick_now is the
+        # timestamp of the refresh in progress, shared by all checks in it
+        self._tick_now: float = time.monotonic()
+        self._last_screen_change: float = self._tick_now
         self._last_image: bytes | None = None  # PNG bytes for camera preview
         self._last_update_success: bool = False
         self._last_update_time: float | None = None
         self.config_entry = config_entry
-        self._camera_images: dict[str, bytes] = {}  # Pre-fetched camera images
-        self._media_images: dict[str, bytes] = {}  # Pre-fetched media player album art
+        # Pre-fetched camera images and media player album art (LRU by entity)
+        self._camera_images: OrderedDict[str, bytes] = OrderedDict()
+        self._media_images: OrderedDict[str, bytes] = OrderedDict()
+        # Cache key -> (url, ETag, Last-Modified) of downloaded images, for conditional GETs
+        self._image_validators: dict[str, tuple[str, str | None, str | None]] = {}
         self._chart_history: dict[str, list[float]] = {}  # Pre-fetched chart history
         self._weather_forecasts: dict[str, list[dict[str, Any]]] = {}  # Pre-fetched forecasts
         self._update_preview: bool = True  # Update preview on next refresh
         self._preview_just_updated: bool = False  # True if preview was updated in last refresh
+        # Renders run in the executor; serialize them so overlapping refreshes
+        # never interleave on the shared renderer and caches below
+        self._render_lock = threading.Lock()
+        # Rendered (jpeg, png) frames keyed by display content fingerprint (LRU)
+        self._render_cache: OrderedDict[tuple, tuple[bytes, bytes | None]] = OrderedDict()
+        # Widgets built for the current screens, keyed by their frozen config so
+        # rebuilding screens reuses widgets whose config did not change
+        self._widget_cache: dict[tuple, Widget] = {}
+        # Change tracking: skip rendering entirely when no tracked entity changed
+        self._dirty: bool = True
+        self._last_frame: tuple[bytes, bytes | None] | None = None
+        self._last_frame_key: tuple | None = None
+        # Last JPEG sent to the device; identical frames are not uploaded again
+        self._last_uploaded_jpeg: bytes | None = None
+        self._last_upload_at: float = 0
+        self._tracked_entities: frozenset[str] = frozenset()
+        self._subscribed_entities: frozenset[str] = frozenset()
+        self._unsub_entity_tracking: Callable[[], None] | None = None
+        self._live_screens: list[bool] = []
+        # Per screen: pre-fetched widget type -> (entity_id, widget) of its widgets
+        self._prefetch_widgets: list[dict[type, list[tuple[str, Any]]]] = []
+        # Decoded camera/media images keyed by their source bytes (LRU)
+        self._decoded_images: OrderedDict[bytes, Image.Image | None] = OrderedDict()
+        self._previous_widget_cache: dict[tuple, Widget] = {}
+        # Last WidgetState of each screen widget with the HA states it was built from
+        self._widget_states: dict[Widget, tuple[tuple[State | None, ...], WidgetState]] = {}
 
         # Device state (updated on refresh)
         self._device_state: DeviceState | None = None
@@ -230,11 +328,17 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         self._device_brightness: int | None = None
         self._last_brightness_poll: float = 0  # Timestamp of last brightness poll
         self._brightness_poll_interval: float = 600  # 10 minutes
+        self._last_space_poll: float | None = None  # Timestamp of last storage info poll
+        self._space_poll_interval: float = 600  # 10 minutes
 
         # Notification state
         self._notification_expiry: float = 0
         self._notification_data: dict[str, Any] | None = None
         self._notification_clear_handle: asyncio.TimerHandle | None = None
+        self._notification_drawn: bool = False  # Last rendered frame shows the notification
+
+        # Welcome screen shown while no screens are configured (built on first use)
+        self._welcome_layout: Layout | None = None
 
         # Display mode tracking
         # "custom" = integration renders views, "builtin" = device shows built-in mode
@@ -246,33 +350,43 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         # to reduce log spam and resource usage
         self._consecutive_failures: int = 0
         self._device_offline: bool = False
-        self._base_update_interval: int = int(
-            options.get(CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL)
-        )
-
-        # Get refresh interval from options
-        interval = self.options.get(CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL)
+        self._base_update_interval: int = self._refresh_interval
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=interval),
+            update_interval=timedelta(seconds=self._refresh_interval),
         )
 
         _LOGGER.debug(
             "Initialized GeekMagic coordinator for %s with refresh interval %ds",
             device.host,
-            interval,
+            self._refresh_interval,
         )
 
         # Initialize screens
         self._setup_screens()
 
-        # Create welcome layout for when no screens are configured
-        self._welcome_layout: Layout | None = None
+    def _apply_options(self, options: Mapping[str, Any]) -> None:
+        """Store options and snapshot the values read on every refresh.
 
-    def _migrate_options(self, options: dict[str, Any]) -> dict[str, Any]:
+        Args:
+            options: Options mapping (read-only, not copied)
+        """
+        self.options = self._migrate_options(options)
+        self._refresh_interval: int = int(
+            self.options.get(CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL)
+        )
+        self._cycle_interval: float = self.options.get(
+            CONF_SCREEN_CYCLE_INTERVAL, DEFAULT_SCREEN_CYCLE_INTERVAL
+        )
+        self._jpeg_quality: int = self.options.get(CONF_JPEG_QUALITY, DEFAULT_JPEG_QUALITY)
+        self._rotation: int = self.options.get(CONF_DISPLAY_ROTATION, DEFAULT_DISPLAY_ROTATION)
+        self._assigned_views: Sequence[str] = self.options.get(CONF_ASSIGNED_VIEWS) or ()
+        self._screens_cfg: Sequence[Mapping[str, Any]] = self.options.get(CONF_SCREENS) or ()
+
+    def _migrate_options(self, options: Mapping[str, Any]) -> Mapping[str, Any]:
         """Migrate old single-screen options to new multi-screen format.
 
         Args:
@@ -305,15 +419,47 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         - Legacy format: screens list with inline config (for backward compatibility)
         """
         self._layouts = []
+        # Cached frames are keyed by screen index, which now may mean another layout
+        self._render_cache.clear()
+        self._widget_states = {}
+        # Keep only widgets still used by the new screens
+        self._previous_widget_cache, self._widget_cache = self._widget_cache, {}
 
         # Check for new format first (global views)
-        assigned_views = self.options.get(CONF_ASSIGNED_VIEWS, [])
-        if assigned_views:
-            self._setup_from_global_views(assigned_views)
+        if self._assigned_views:
+            self._setup_from_global_views(self._assigned_views)
         else:
             # Fall back to legacy format
             self._setup_from_legacy_screens()
 
+        self._previous_widget_cache = {}
+
+        # Entities to watch for changes, and screens that must render every refresh
+        self._tracked_entities = frozenset(
+            eid
+            for layout in self._layouts
+            for slot in layout.slots
+            if slot.widget is not None
+            for eid in (slot.widget.config.entity_id, *slot.widget.get_entities())
+            if eid
+        )
+        self._live_screens = [
+            any(isinstance(slot.widget, LIVE_WIDGET_TYPES) for slot in layout.slots)
+            for layout in self._layouts
+        ]
+        self._prefetch_widgets = [
+            {
+                widget_type: [
+                    (slot.widget.config.entity_id, slot.widget)
+                    for slot in layout.slots
+                    if isinstance(slot.widget, widget_type) and slot.widget.config.entity_id
+                ]
+                for widget_type in PREFETCH_WIDGET_TYPES
+            }
+            for layout in self._layouts
+        ]
+        self._dirty = True
+
         # Ensure current screen is valid
         if self._current_screen >= len(self._layouts):
             _LOGGER.debug(
@@ -322,7 +468,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             )
             self._current_screen = 0
 
-    def _setup_from_global_views(self, view_ids: list[str]) -> None:
+    def _setup_from_global_views(self, view_ids: Sequence[str]) -> None:
         """Set up layouts from global views in store.
 
         Args:
@@ -355,7 +501,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
     def _setup_from_legacy_screens(self) -> None:
         """Set up layouts from legacy screens config (backward compatibility)."""
-        screens = self.options.get(CONF_SCREENS, [])
+        screens = self._screens_cfg
         _LOGGER.debug("Setting up %d screen(s) from legacy config", len(screens))
 
         for i, screen_config in enumerate(screens):
@@ -446,6 +592,23 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
         return layout
 
+    def _get_welcome_layout(self, entity_count: int) -> Layout:
+        """Get the welcome layout, updated with the current entity count.
+
+        Args:
+            entity_count: Number of entities to show
+
+        Returns:
+            The welcome layout, built on first use and reused afterwards
+        """
+        if self._welcome_layout is None:
+            self._welcome_layout = self._create_welcome_layout()
+        # Only the entity count changes while HA is running
+        entity_widget = self._welcome_layout.slots[2].widget
+        if isinstance(entity_widget, TextWidget):
+            entity_widget.text = str(entity_count)
+        return self._welcome_layout
+
     def _get_ha_version(self) -> str:
         """Get Home Assistant version string."""
         return ha_version
@@ -453,7 +616,9 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
     def _get_entity_count(self) -> int:
         """Get total number of entities in Home Assistant."""
         try:
-            return len(self.hass.states.async_all())
+            # Counts the state machine's index directly; async_all() would
+            # build a list of every State just to measure it
+            return self.hass.states.async_entity_ids_count()
         except Exception:
             return 0
 
@@ -480,14 +645,19 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         if not widgets_config:
             widgets_config = [{"type": "clock", "slot": 0}]
 
+        slot_count = layout.get_slot_count()
+        get_widget_class = WIDGET_CLASSES.get
+        widget_cache = self._widget_cache
+        previous_widget_cache = self._previous_widget_cache
+
         for widget_config in widgets_config:
             widget_type = str(widget_config.get("type", "text"))
             slot = int(widget_config.get("slot", 0))
 
-            if slot >= layout.get_slot_count():
+            if slot >= slot_count:
                 continue
 
-            widget_class = WIDGET_CLASSES.get(widget_type)
+            widget_class = get_widget_class(widget_type)
             if widget_class is None:
                 continue
 
@@ -501,16 +671,31 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             if isinstance(raw_color, list | tuple) and len(raw_color) == 3:
                 parsed_color = (int(raw_color[0]), int(raw_color[1]), int(raw_color[2]))
 
-            config = WidgetConfig(
-                widget_type=widget_type,
-                slot=slot,
-                entity_id=str(entity_id) if entity_id is not None else None,
-                label=str(label) if label is not None else None,
-                color=parsed_color,
-                options=cast("dict[str, Any]", widget_options),
+            entity_id = str(entity_id) if entity_id is not None else None
+            label = str(label) if label is not None else None
+
+            # Widgets render purely from config + state, so identical configs
+            # can share one instance
+            cache_key = (
+                widget_type,
+                slot,
+                entity_id,
+                label,
+                parsed_color,
+                _freeze_options(widget_options),
             )
-
-            widget = widget_class(config)
+            widget = widget_cache.get(cache_key) or previous_widget_cache.get(cache_key)
+            if widget is None:
+                config = WidgetConfig(
+                    widget_type=widget_type,
+                    slot=slot,
+                    entity_id=entity_id,
+                    label=label,
+                    color=parsed_color,
+                    options=cast("dict[str, Any]", widget_options),
+                )
+                widget = widget_class(config)
+            widget_cache[cache_key] = widget
             layout.set_widget(slot, widget)
 
         return layout
@@ -529,7 +714,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
     def current_screen_name(self) -> str:
         """Get current screen name."""
         # Check for new format first
-        assigned_views = self.options.get(CONF_ASSIGNED_VIEWS, [])
+        assigned_views = self._assigned_views
         if assigned_views:
             if 0 <= self._current_screen < len(assigned_views):
                 store = self._get_store()
@@ -540,7 +725,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             return "Unknown"
 
         # Legacy format
-        screens = self.options.get(CONF_SCREENS, [])
+        screens = self._screens_cfg
         if 0 <= self._current_screen < len(screens):
             return screens[self._current_screen].get("name", f"Screen {self._current_screen + 1}")
         return "Unknown"
@@ -553,7 +738,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         """
         if 0 <= screen_index < len(self._layouts):
             self._current_screen = screen_index
-            self._last_screen_change = time.time()
+            self._last_screen_change = time.monotonic()
 
             # If in builtin mode, switch to custom mode so the screen change is rendered
             if self._display_mode == "builtin":
@@ -589,18 +774,17 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 except Exception as err:
                     _LOGGER.debug("Pro navigate_previous failed (non-fatal): %s", err)
 
-    def update_options(self, options: dict[str, Any]) -> None:
+    def update_options(self, options: Mapping[str, Any]) -> None:
         """Update coordinator options.
 
         Args:
-            options: New options dictionary
+            options: New options mapping (read-only, not copied)
         """
-        self.options = self._migrate_options(options)
+        self._apply_options(options)
 
         # Update refresh interval
-        interval = int(self.options.get(CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL))
-        self._base_update_interval = interval
-        self.update_interval = timedelta(seconds=interval)
+        self._base_update_interval = self._refresh_interval
+        self.update_interval = timedelta(seconds=self._refresh_interval)
 
         # Rebuild all screens
         self._setup_screens()
@@ -608,20 +792,20 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         # Update preview on next refresh (config changed)
         self._update_preview = True
 
-    def _build_widget_states(self, layout: Layout) -> dict[int, WidgetState]:
+    def _build_widget_states(
+        self, layout: Layout, reuse_states: bool = False
+    ) -> dict[int, WidgetState]:
         """Build WidgetState for all widgets in a layout.
 
         Args:
             layout: Layout with widgets to build states for
+            reuse_states: Reuse the previous state of widgets that do not depend
+                on time or pre-fetched data when none of their entities changed
 
         Returns:
             Dict mapping slot index to WidgetState
         """
         from datetime import UTC
-        from io import BytesIO
-        from zoneinfo import ZoneInfo
-
-        from PIL import Image
 
         states: dict[int, WidgetState] = {}
 
@@ -629,33 +813,63 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         tz = getattr(self.hass.config, "time_zone_obj", None) or UTC
         now = datetime.now(tz=tz)
 
-        for slot in layout.slots:
-            widget = slot.widget
-            if widget is None:
-                continue
+        slot_widgets = [
+            (slot.index, slot.widget) for slot in layout.slots if slot.widget is not None
+        ]
 
-            # Build EntityState for primary entity
-            primary_entity = None
-            if widget.config.entity_id:
-                ha_state = self.hass.states.get(widget.config.entity_id)
-                if ha_state:
-                    primary_entity = EntityState(
+        # Look up every entity the layout uses once, so entities shared by
+        # several widgets are resolved only once
+        widget_entities = {
+            widget: tuple(
+                dict.fromkeys(
+                    eid for eid in (widget.config.entity_id, *widget.get_entities()) if eid
+                )
+            )
+            for _, widget in slot_widgets
+        }
+        ha_states = {
+            eid: self.hass.states.get(eid) for eids in widget_entities.values() for eid in eids
+        }
+
+        # HA replaces the State object on every change, so a widget whose
+        # entities still resolve to the same objects would get an identical state
+        previous_states = self._widget_states if reuse_states else {}
+        rebuild: list[tuple[int, Widget]] = []
+        for slot_index, widget in slot_widgets:
+            cached = previous_states.get(widget)
+            if cached is not None and all(
+                ha_states[eid] is source
+                for eid, source in zip(widget_entities[widget], cached[0], strict=True)
+            ):
+                states[slot_index] = cached[1]
+            else:
+                rebuild.append((slot_index, widget))
+
+        # Wrap the entities of widgets being rebuilt. HA state attributes are
+        # already a read-only dict, so they are shared, not copied.
+        entity_states: dict[str, EntityState] = {}
+        for _, widget in rebuild:
+            for eid in widget_entities[widget]:
+                ha_state = ha_states[eid]
+                if ha_state and eid not in entity_states:
+                    entity_states[eid] = EntityState(
                         entity_id=ha_state.entity_id,
                         state=ha_state.state,
-                        attributes=dict(ha_state.attributes),
+                        attributes=ha_state.attributes,
                     )
 
-            # Build EntityState for additional entities
-            additional: dict[str, EntityState] = {}
-            for eid in widget.get_entities():
-                if eid != widget.config.entity_id:
-                    ha_state = self.hass.states.get(eid)
-                    if ha_state:
-                        additional[eid] = EntityState(
-                            entity_id=ha_state.entity_id,
-                            state=ha_state.state,
-                            attributes=dict(ha_state.attributes),
-                        )
+        for slot_index, widget in rebuild:
+            # EntityState for primary entity
+            primary_entity = (
+                entity_states.get(widget.config.entity_id) if widget.config.entity_id else None
+            )
+
+            # EntityState for additional entities
+            additional: dict[str, EntityState] = {
+                eid: entity_states[eid]
+                for eid in widget.get_entities()
+                if eid != widget.config.entity_id and eid in entity_states
+            }
 
             # Get pre-fetched chart history
             history: list[float] = []
@@ -667,13 +881,11 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             if isinstance(widget, CameraWidget) and widget.config.entity_id:
                 image_bytes = self._camera_images.get(widget.config.entity_id)
                 if image_bytes:
-                    with contextlib.suppress(Exception):
-                        image = Image.open(BytesIO(image_bytes))
+                    image = self._decode_image(image_bytes)
             elif isinstance(widget, MediaWidget) and widget.config.entity_id:
                 image_bytes = self._media_images.get(widget.config.entity_id)
                 if image_bytes:
-                    with contextlib.suppress(Exception):
-                        image = Image.open(BytesIO(image_bytes))
+                    image = self._decode_image(image_bytes)
 
             # Get pre-fetched weather forecast
             forecast: list[dict[str, Any]] = []
@@ -684,10 +896,12 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             widget_now = now
             if isinstance(widget, ClockWidget) and hasattr(widget, "timezone") and widget.timezone:
                 with contextlib.suppress(Exception):
-                    widget_tz = ZoneInfo(widget.timezone)
-                    widget_now = datetime.now(tz=widget_tz)
+                    widget_tz = _ZONEINFO_CACHE.get(widget.timezone)
+                    if widget_tz is None:
+                        widget_tz = _ZONEINFO_CACHE[widget.timezone] = ZoneInfo(widget.timezone)
+                    widget_now = now.astimezone(widget_tz)
 
-            states[slot.index] = WidgetState(
+            states[slot_index] = WidgetState(
                 entity=primary_entity,
                 entities=additional,
                 history=history,
@@ -695,48 +909,187 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 forecast=forecast,
                 now=widget_now,
             )
+            if reuse_states and not isinstance(widget, LIVE_WIDGET_TYPES):
+                self._widget_states[widget] = (
+                    tuple(ha_states[eid] for eid in widget_entities[widget]),
+                    states[slot_index],
+                )
 
         return states
 
-    def _render_display(self) -> tuple[bytes, bytes]:
-        """Render the display image (runs in executor thread).
+    def _decode_image(self, image_bytes: bytes) -> Image.Image | None:
+        """Decode pre-fetched image bytes, reusing the result for unchanged bytes.
+
+        Camera frames and album art are often byte-identical between
+        refreshes, so decoded images are kept in a small LRU keyed by the
+        bytes themselves. Images are fully loaded and converted to RGB once;
+        widgets only read from them. JPEGs are decoded at the smallest DCT
+        scale that still covers the supersampled canvas, since no widget
+        draws an image larger than that.
+
+        Args:
+            image_bytes: Encoded image data
 
         Returns:
-            Tuple of (jpeg_data, png_data)
+            Decoded RGB image, or None if the data could not be decoded
         """
-        # Create canvas
-        img, draw = self.renderer.create_canvas()
+        from io import BytesIO
 
-        # Render current screen's layout
-        if self._layouts and 0 <= self._current_screen < len(self._layouts):
-            layout = self._layouts[self._current_screen]
+        from PIL import Image
 
-            # Check for active notification
-            if time.time() < self._notification_expiry and self._notification_data:
-                _LOGGER.debug("Rendering active notification")
-                layout = self._create_notification_layout(self._notification_data)
+        cache = self._decoded_images
+        if image_bytes in cache:
+            cache.move_to_end(image_bytes)
+            return cache[image_bytes]
 
-            _LOGGER.debug(
-                "Rendering layout %s with %d widgets",
-                type(layout).__name__,
-                sum(1 for s in layout.slots if s.widget is not None),
+        image: Image.Image | None
+        try:
+            image = Image.open(BytesIO(image_bytes))
+            # No-op for formats other than JPEG
+            image.draft(
+                "RGB",
+                (self.renderer.width * SUPERSAMPLE_SCALE, self.renderer.height * SUPERSAMPLE_SCALE),
             )
-            # Build widget states
-            widget_states = self._build_widget_states(layout)
-            layout.render(self.renderer, draw, widget_states)
-        else:
+            image.load()
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+        except Exception:
+            image = None
+
+        cache[image_bytes] = image
+        if len(cache) > DECODED_IMAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return image
+
+    def _render_fingerprint(self, layout: Layout) -> tuple:
+        """Build a hashable fingerprint of everything a layout renders from.
+
+        Widgets render purely from their config and WidgetState, so the
+        fingerprint covers the HA states of the entities each widget uses,
+        pre-fetched data (history, images, forecasts) and, for time-driven
+        widgets, the current second or minute.
+
+        Args:
+            layout: Layout about to be rendered
+
+        Returns:
+            Tuple that compares equal only when the rendered output would
+        """
+        states = self.hass.states
+        epoch = int(time.time())
+        parts: list[tuple] = []
+
+        for slot in layout.slots:
+            widget = slot.widget
+            if widget is None:
+                continue
+
+            entity_id = widget.config.entity_id
+            # HA replaces the State object (and last_updated) whenever the
+            # state or any attribute changes
+            entity_tokens = tuple(
+                (eid, ha_state.last_updated if (ha_state := states.get(eid)) else None)
+                for eid in (entity_id, *widget.get_entities())
+                if eid
+            )
+
+            time_token: int | None = None
+            data_token: Any = None
+            if isinstance(widget, ClockWidget):
+                time_token = epoch if widget.show_seconds else epoch // 60
+            elif isinstance(widget, MediaWidget):
+                time_token = epoch  # Playback position advances every second
+                data_token = self._media_images.get(entity_id) if entity_id else None
+            elif isinstance(widget, CameraWidget) and entity_id:
+                data_token = self._camera_images.get(entity_id)
+            elif isinstance(widget, ChartWidget) and entity_id:
+                data_token = tuple(self._chart_history.get(entity_id, ()))
+            elif isinstance(widget, WeatherWidget) and entity_id:
+                data_token = repr(self._weather_forecasts.get(entity_id))
+
+            parts.append((slot.index, entity_tokens, time_token, data_token))
+
+        return tuple(parts)
+
+    def _render_display(self, include_png: bool = False) -> tuple[bytes, bytes | None]:
+        """Render the display image (runs in executor thread).
+
+        Frames are cached by content fingerprint, so refreshes where nothing
+        on screen changed skip drawing and encoding entirely.
+
+        Args:
+            include_png: Also encode a PNG for the preview entity
+
+        Returns:
+            Tuple of (jpeg_data, png_data); png_data is None unless requested
+        """
+        with self._render_lock:
+            return self._render_display_locked(include_png)
+
+    def _render_display_locked(self, include_png: bool) -> tuple[bytes, bytes | None]:
+        """Render the display image while holding the render lock.
+
+        Args:
+            include_png: Also encode a PNG for the preview entity
+
+        Returns:
+            Tuple of (jpeg_data, png_data); png_data is None unless requested
+        """
+        # Pick the layout for the current screen
+        layout_key: tuple
+        has_screen = bool(self._layouts) and 0 <= self._current_screen < len(self._layouts)
+        # Check for an active notification first; it only replaces configured screens
+        notification = (
+            self._notification_data
+            if has_screen and self._tick_now < self._notification_expiry
+            else None
+        )
+        self._notification_drawn = bool(notification)
+        if not has_screen:
             # No screens configured - show welcome screen with live data
             _LOGGER.debug("No screens configured, rendering welcome screen")
-            # Recreate welcome layout each time to get fresh HA stats
-            welcome_layout = self._create_welcome_layout()
-            widget_states = self._build_widget_states(welcome_layout)
-            welcome_layout.render(self.renderer, draw, widget_states)
-
-        # Encode to both formats
-        jpeg_quality = self.options.get(CONF_JPEG_QUALITY, DEFAULT_JPEG_QUALITY)
-        rotation = self.options.get(CONF_DISPLAY_ROTATION, DEFAULT_DISPLAY_ROTATION)
+            entity_count = self._get_entity_count()
+            layout = self._get_welcome_layout(entity_count)
+            layout_key = ("welcome", entity_count)
+        else:
+            if notification:
+                _LOGGER.debug("Rendering active notification")
+                layout = self._create_notification_layout(notification)
+                layout_key = ("notification", self._notification_expiry)
+            else:
+                layout = self._layouts[self._current_screen]
+                layout_key = ("screen", self._current_screen)
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Rendering layout %s with %d widgets",
+                    type(layout).__name__,
+                    sum(1 for s in layout.slots if s.widget is not None),
+                )
+
+        jpeg_quality = self._jpeg_quality
+        rotation = self._rotation
+
+        cache_key = (layout_key, jpeg_quality, rotation, self._render_fingerprint(layout))
+        cached = self._render_cache.get(cache_key)
+        if cached is not None and (cached[1] is not None or not include_png):
+            self._render_cache.move_to_end(cache_key)
+            _LOGGER.debug("Display content unchanged, reusing rendered frame")
+            return cached
+
+        # Clear the persistent canvas and render with fresh widget states
+        # (frames are encoded below, before the canvas is reused)
+        img, draw = self.renderer.get_reusable_canvas()
+        widget_states = self._build_widget_states(layout, reuse_states=layout_key[0] == "screen")
+        layout.render(self.renderer, draw, widget_states)
+
+        # Encode for the device, and for the preview only when it will be shown
         jpeg_data = self.renderer.to_jpeg(img, quality=jpeg_quality, rotation=rotation)
-        png_data = self.renderer.to_png(img, rotation=rotation)
+        png_data = self.renderer.to_png(img, rotation=rotation) if include_png else None
+
+        self._render_cache[cache_key] = (jpeg_data, png_data)
+        if len(self._render_cache) > RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
 
         return jpeg_data, png_data
 
@@ -748,7 +1101,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         """
         duration = data.get("duration", 10)
         self._notification_data = data
-        self._notification_expiry = time.time() + duration
+        self._notification_expiry = time.monotonic() + duration
 
         # Cancel any pending clear callback to prevent race conditions
         if self._notification_clear_handle is not None:
@@ -763,10 +1116,12 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         await self.async_request_refresh()
 
     def _clear_notification(self) -> None:
-        """Clear the active notification and refresh."""
+        """Clear the active notification and refresh if it is on screen."""
         self._notification_expiry = 0
         self._notification_data = None
         self._notification_clear_handle = None
+        if not self._notification_drawn:
+            return
         # Use fire-and-forget for the refresh since this is a callback
         self.hass.async_create_task(self.async_request_refresh())
 
@@ -882,6 +1237,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         Returns:
             Dictionary with update status
         """
+        self._tick_now = time.monotonic()
         try:
             # If device was offline, do a lightweight connectivity check first
             # to avoid expensive rendering operations
@@ -911,62 +1267,39 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 )
                 self._reset_backoff()
 
-            _LOGGER.debug(
-                "Starting display update for screen %d/%d (%s)",
-                self._current_screen + 1,
-                len(self._layouts),
-                self.current_screen_name,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Starting display update for screen %d/%d (%s)",
+                    self._current_screen + 1,
+                    len(self._layouts),
+                    self.current_screen_name,
+                )
 
             # Check for auto-cycling
-            cycle_interval = self.options.get(
-                CONF_SCREEN_CYCLE_INTERVAL, DEFAULT_SCREEN_CYCLE_INTERVAL
-            )
-            if cycle_interval > 0 and len(self._layouts) > 1:
-                now = time.time()
-                if now - self._last_screen_change >= cycle_interval:
-                    old_screen = self._current_screen
-                    self._current_screen = (self._current_screen + 1) % len(self._layouts)
-                    self._last_screen_change = now
-                    _LOGGER.debug(
-                        "Auto-cycled screen from %d to %d",
-                        old_screen,
-                        self._current_screen,
-                    )
-
-            # Poll device brightness on first update and every 10 minutes
-            now = time.time()
+            cycle_interval = self._cycle_interval
+            now = self._tick_now
             if (
-                self._device_brightness is None
-                or now - self._last_brightness_poll >= self._brightness_poll_interval
+                cycle_interval > 0
+                and len(self._layouts) > 1
+                and now - self._last_screen_change >= cycle_interval
             ):
-                try:
-                    self._device_brightness = await self.device.get_brightness()
-                    self._last_brightness_poll = now
-                    _LOGGER.debug("Polled device brightness: %d", self._device_brightness)
-                except Exception as e:
-                    _LOGGER.debug("Failed to poll device brightness: %s", e)
-
-            # Fetch device state and storage info
-            try:
-                self._device_state = await self.device.get_state()
-                self._space_info = await self.device.get_space()
-
-                # Sync display mode with device state on first poll
-                # If device is in a built-in theme, respect that
-                if self._device_state and self._device_state.theme is not None:
-                    device_theme = self._device_state.theme
-                    if device_theme < 3 and self._display_mode == "custom":
-                        # Device is in built-in mode but we thought we were in custom
-                        # This can happen on startup - sync to device state
-                        _LOGGER.debug(
-                            "Syncing display mode from device: builtin (theme=%d)",
-                            device_theme,
-                        )
-                        self._display_mode = "builtin"
-                        self._builtin_theme = device_theme
-            except Exception as e:
-                _LOGGER.debug("Failed to fetch device state: %s", e)
+                old_screen = self._current_screen
+                self._current_screen = (self._current_screen + 1) % len(self._layouts)
+                self._last_screen_change = now
+                _LOGGER.debug(
+                    "Auto-cycled screen from %d to %d",
+                    old_screen,
+                    self._current_screen,
+                )
+
+            # Poll device state, plus brightness and storage info on the first
+            # update and every 10 minutes. The requests are independent, so run
+            # them concurrently; each handles its own failure
+            await asyncio.gather(
+                self._async_poll_device_state(),
+                self._async_poll_brightness(),
+                self._async_poll_space(),
+            )
 
             # Skip rendering when in built-in mode
             # The device handles display in built-in modes (Clock, Weather, System Info)
@@ -975,6 +1308,8 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                     "Skipping render - device in built-in mode (theme=%d)",
                     self._builtin_theme,
                 )
+                # The device no longer shows our last frame
+                self._last_uploaded_jpeg = None
                 return {
                     "success": True,
                     "builtin_mode": True,
@@ -982,40 +1317,88 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 }
 
             # Pre-fetch async data (camera images, media art, chart history, weather forecasts)
-            # (must be done in async context)
-            await self._async_fetch_camera_images()
-            await self._async_fetch_media_images()
-            await self._async_fetch_chart_history()
-            await self._async_fetch_weather_forecasts()
+            # (must be done in async context). The stages are independent, so
+            # run them concurrently; each handles its own per-entity failures
+            if self._has_prefetch_work():
+                results = await asyncio.gather(
+                    self._async_fetch_camera_images(),
+                    self._async_fetch_media_images(),
+                    self._async_fetch_chart_history(),
+                    self._async_fetch_weather_forecasts(),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        _LOGGER.debug("Failed to pre-fetch widget data: %s", result)
 
             # Render image in executor to avoid blocking the event loop
             # (Pillow image operations are CPU-intensive)
-            jpeg_data, png_data = await self.hass.async_add_executor_job(self._render_display)
+            # The PNG is only needed to refresh the preview entity, which
+            # updates on config changes and manual refreshes only
+            include_png = self._update_preview
+            self._async_sync_entity_tracking()
+            if (
+                self._needs_render()
+                or self._last_frame is None
+                or (include_png and self._last_frame[1] is None)
+            ):
+                # Clear first so changes arriving while rendering mark it dirty again
+                self._dirty = False
+                try:
+                    self._last_frame = await self.hass.async_add_executor_job(
+                        self._render_display, include_png
+                    )
+                except Exception:
+                    self._dirty = True
+                    raise
+            else:
+                _LOGGER.debug("No tracked entity changed, reusing last rendered frame")
+            jpeg_data, png_data = self._last_frame
 
             # Only update preview image on config changes or manual refresh
             # (prevents HA UI from refreshing during periodic updates)
-            self._preview_just_updated = self._update_preview
-            if self._update_preview:
+            self._preview_just_updated = include_png
+            if include_png:
                 self._last_image = png_data
                 self._update_preview = False
 
-            _LOGGER.debug(
-                "Rendered image: JPEG=%d bytes, PNG=%d bytes",
-                len(jpeg_data),
-                len(png_data),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Rendered image: JPEG=%d bytes, PNG=%s",
+                    len(jpeg_data),
+                    f"{len(png_data)} bytes" if png_data is not None else "skipped",
+                )
 
-            await self.device.upload_and_display(jpeg_data, "dashboard.jpg")
+            if (
+                not include_png
+                and jpeg_data == self._last_uploaded_jpeg
+                and self._tick_now - self._last_upload_at < UNCHANGED_UPLOAD_INTERVAL
+            ):
+                _LOGGER.debug("Frame unchanged since last upload, skipping upload")
+            else:
+                try:
+                    await asyncio.wait_for(
+                        self.device.upload_and_display(jpeg_data, "dashboard.jpg"),
+                        timeout=UPLOAD_TIMEOUT,
+                    )
+                except TimeoutError as err:
+                    # Handled below like any other connection error, so a device
+                    # that stops answering goes offline and backs off
+                    msg = f"Upload timed out after {UPLOAD_TIMEOUT}s"
+                    raise TimeoutError(msg) from err
+                self._last_uploaded_jpeg = jpeg_data
+                self._last_upload_at = self._tick_now
 
             # Track success status
             self._last_update_success = True
             self._last_update_time = time.time()
 
-            _LOGGER.debug(
-                "Display update completed: screen=%s, size=%.1fKB",
-                self.current_screen_name,
-                len(jpeg_data) / 1024,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Display update completed: screen=%s, size=%.1fKB",
+                    self.current_screen_name,
+                    len(jpeg_data) / 1024,
+                )
 
             return {
                 "success": True,
@@ -1036,6 +1419,109 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             self._log_connection_error(err)
             raise UpdateFailed(f"Error updating display: {err}") from err
 
+    async def _async_poll_device_state(self) -> None:
+        """Fetch the device state and sync the display mode with it."""
+        try:
+            self._device_state = await self.device.get_state()
+        except Exception as e:
+            _LOGGER.debug("Failed to fetch device state: %s", e)
+            return
+
+        # Sync display mode with device state on first poll
+        # If device is in a built-in theme, respect that
+        if self._device_state and self._device_state.theme is not None:
+            device_theme = self._device_state.theme
+            if device_theme < 3 and self._display_mode == "custom":
+                # Device is in built-in mode but we thought we were in custom
+                # This can happen on startup - sync to device state
+                _LOGGER.debug(
+                    "Syncing display mode from device: builtin (theme=%d)",
+                    device_theme,
+                )
+                self._display_mode = "builtin"
+                self._builtin_theme = device_theme
+
+    async def _async_poll_brightness(self) -> None:
+        """Fetch the device brightness on the first update and every 10 minutes."""
+        now = self._tick_now
+        if (
+            self._device_brightness is not None
+            and now - self._last_brightness_poll < self._brightness_poll_interval
+        ):
+            return
+        try:
+            self._device_brightness = await self.device.get_brightness()
+            self._last_brightness_poll = now
+            _LOGGER.debug("Polled device brightness: %d", self._device_brightness)
+        except Exception as e:
+            _LOGGER.debug("Failed to poll device brightness: %s", e)
+
+    async def _async_poll_space(self) -> None:
+        """Fetch the device storage info on the first update and every 10 minutes."""
+        now = self._tick_now
+        if (
+            self._last_space_poll is not None
+            and now - self._last_space_poll < self._space_poll_interval
+        ):
+            return
+        try:
+            self._space_info = await self.device.get_space()
+            self._last_space_poll = now
+        except Exception as e:
+            _LOGGER.debug("Failed to fetch device storage info: %s", e)
+
+    @callback
+    def _async_sync_entity_tracking(self) -> None:
+        """Subscribe to state changes of the entities used by the current screens."""
+        if self._tracked_entities == self._subscribed_entities:
+            return
+        if self._unsub_entity_tracking is not None:
+            self._unsub_entity_tracking()
+            self._unsub_entity_tracking = None
+        self._subscribed_entities = self._tracked_entities
+        if self._tracked_entities:
+            self._unsub_entity_tracking = async_track_state_change_event(
+                self.hass, self._tracked_entities, self._async_on_entity_change
+            )
+
+    @callback
+    def _async_on_entity_change(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the display dirty when a tracked entity changes."""
+        self._dirty = True
+
+    def _needs_render(self) -> bool:
+        """Check whether the display has to be rendered on this refresh.
+
+        Returns:
+            False only if the last frame is still accurate: same screen and
+            notification, no tracked entity changed, and no time-driven widgets
+        """
+        notification_active = bool(
+            self._tick_now < self._notification_expiry and self._notification_data
+        )
+        frame_key = (
+            self._current_screen,
+            self._notification_expiry if notification_active else None,
+        )
+        if frame_key != self._last_frame_key:
+            self._last_frame_key = frame_key
+            return True
+        return (
+            self._dirty
+            or self._last_frame is None
+            or notification_active
+            or not 0 <= self._current_screen < len(self._live_screens)
+            or self._live_screens[self._current_screen]
+        )
+
+    async def async_shutdown(self) -> None:
+        """Stop tracking entity changes and shut down the coordinator."""
+        if self._unsub_entity_tracking is not None:
+            self._unsub_entity_tracking()
+            self._unsub_entity_tracking = None
+        self._subscribed_entities = frozenset()
+        await super().async_shutdown()
+
     def _apply_backoff(self) -> None:
         """Apply exponential backoff to update interval.
 
@@ -1058,6 +1544,8 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         self._consecutive_failures = 0
         self._device_offline = False
         self.update_interval = timedelta(seconds=self._base_update_interval)
+        # The device may have restarted while offline
+        self._last_uploaded_jpeg = None
 
     def _log_offline_status(self, message: str) -> None:
         """Log device offline status with smart verbosity.
@@ -1234,7 +1722,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         else:
             # Custom mode - value is view index
             self._current_screen = value
-            self._last_screen_change = time.time()
+            self._last_screen_change = time.monotonic()
 
     async def async_set_brightness(self, brightness: int) -> None:
         """Set display brightness.
@@ -1259,6 +1747,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         await self.device.set_theme_custom()
 
         self._update_preview = True  # Update preview on manual refresh
+        self._dirty = True  # Manual refresh always renders a fresh frame
         await self.async_request_refresh()
 
     async def async_reload_views(self) -> None:
@@ -1270,28 +1759,61 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         self._update_preview = True
         await self.async_request_refresh()
 
+    def _screen_prefetch_widgets(self, widget_type: type) -> list[tuple[str, Any]]:
+        """Get the widgets of a pre-fetched type on the current screen.
+
+        Args:
+            widget_type: One of PREFETCH_WIDGET_TYPES
+
+        Returns:
+            List of (entity_id, widget) for widgets with an entity configured
+        """
+        if 0 <= self._current_screen < len(self._prefetch_widgets):
+            return self._prefetch_widgets[self._current_screen][widget_type]
+        return []
+
+    def _has_prefetch_work(self) -> bool:
+        """Check whether the current screen or notification needs pre-fetched data.
+
+        Returns:
+            True if any pre-fetched widget is shown or the notification has an image
+        """
+        if self._notification_data and self._notification_data.get("image"):
+            return True
+        return any(map(self._screen_prefetch_widgets, PREFETCH_WIDGET_TYPES))
+
     async def _async_fetch_camera_images(self) -> None:
         """Pre-fetch camera images for all camera widgets.
 
         This must be called from the async context before rendering,
         since camera.async_get_image() is async.
         """
-        from homeassistant.components.camera import async_get_image
+        camera_entity_ids, other_entity_ids = self._camera_image_sources()
+        # Media players also shown by a media widget are downloaded once, by
+        # the album art fetch, which fills both caches
+        other_entity_ids -= self._media_entity_ids()
+
+        # Fetch all images concurrently; non-camera entities populate the same
+        # cache, and both fetchers handle their own errors
+        await asyncio.gather(
+            *(self._async_fetch_url_image_to_cache(entity_id) for entity_id in other_entity_ids),
+            *(self._async_fetch_camera_image(entity_id) for entity_id in camera_entity_ids),
+        )
+
+    def _camera_image_sources(self) -> tuple[set[str], set[str]]:
+        """Get the image sources of camera widgets and the active notification.
 
-        # Find all camera/image widgets in current layout
+        Returns:
+            Tuple of (camera entity IDs, other entity IDs with an entity_picture)
+        """
         camera_entity_ids: set[str] = set()
         other_entity_ids: set[str] = set()
 
-        if self._layouts and 0 <= self._current_screen < len(self._layouts):
-            layout = self._layouts[self._current_screen]
-            for slot in layout.slots:
-                if slot.widget and isinstance(slot.widget, CameraWidget):
-                    entity_id = slot.widget.config.entity_id
-                    if entity_id:
-                        if entity_id.startswith("camera."):
-                            camera_entity_ids.add(entity_id)
-                        else:
-                            other_entity_ids.add(entity_id)
+        for entity_id, _ in self._screen_prefetch_widgets(CameraWidget):
+            if entity_id.startswith("camera."):
+                camera_entity_ids.add(entity_id)
+            else:
+                other_entity_ids.add(entity_id)
 
         # Also collect entities from notification
         if self._notification_data:
@@ -1302,23 +1824,31 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 else:
                     other_entity_ids.add(image_source)
 
-        # Fetch non-camera entities first (they populate the same cache)
-        for entity_id in other_entity_ids:
-            await self._async_fetch_url_image_to_cache(entity_id)
+        return camera_entity_ids, other_entity_ids
 
-        # Fetch images for each camera
-        for entity_id in camera_entity_ids:
-            try:
-                image = await async_get_image(self.hass, entity_id)
-                if image and image.content:
-                    self._camera_images[entity_id] = image.content
-                    _LOGGER.debug(
-                        "Fetched camera image for %s: %d bytes",
-                        entity_id,
-                        len(image.content),
-                    )
-            except Exception as e:
-                _LOGGER.debug("Failed to fetch camera image for %s: %s", entity_id, e)
+    def _media_entity_ids(self) -> set[str]:
+        """Get the media players shown by media widgets on the current screen."""
+        return {entity_id for entity_id, _ in self._screen_prefetch_widgets(MediaWidget)}
+
+    async def _async_fetch_camera_image(self, entity_id: str) -> None:
+        """Fetch a camera snapshot and save it to the camera image cache.
+
+        Args:
+            entity_id: Camera entity ID
+        """
+        from homeassistant.components.camera import async_get_image
+
+        try:
+            image = await async_get_image(self.hass, entity_id)
+            if image and image.content:
+                self._store_image(self._camera_images, entity_id, image.content)
+                _LOGGER.debug(
+                    "Fetched camera image for %s: %d bytes",
+                    entity_id,
+                    len(image.content),
+                )
+        except Exception as e:
+            _LOGGER.debug("Failed to fetch camera image for %s: %s", entity_id, e)
 
     async def _async_fetch_url_image_to_cache(self, source: str) -> None:
         """Fetch image from entity_picture and save to camera image cache.
@@ -1346,26 +1876,107 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         full_url = f"{base_url.rstrip('/')}/{image_url.lstrip('/')}"
 
         try:
-            # Use Home Assistant's managed session for proper SSL/auth handling
-            session = async_get_clientsession(self.hass)
-            async with session.get(full_url, timeout=10) as response:
-                if response.status == 200:
-                    image_data = await response.read()
-                    self._camera_images[source] = image_data
-                    _LOGGER.debug(
-                        "Fetched image for notification from %s: %d bytes",
-                        source,
-                        len(image_data),
-                    )
-                else:
-                    _LOGGER.debug(
-                        "Failed to fetch notification image from %s: HTTP %d",
-                        source,
-                        response.status,
-                    )
+            status = await self._async_download_image(self._camera_images, source, full_url)
+            if status == 200:
+                _LOGGER.debug(
+                    "Fetched image for notification from %s: %d bytes",
+                    source,
+                    len(self._camera_images[source]),
+                )
+            elif status != 304:
+                _LOGGER.debug(
+                    "Failed to fetch notification image from %s: HTTP %d",
+                    source,
+                    status,
+                )
         except Exception as e:
             _LOGGER.debug("Failed to fetch notification image from %s: %s", source, e)
 
+    def _store_image(self, cache: OrderedDict[str, bytes], key: str, data: bytes) -> None:
+        """Store downloaded image bytes, evicting the least recently stored images.
+
+        Args:
+            cache: Camera or media image cache
+            key: Cache key (entity ID)
+            data: Encoded image bytes
+        """
+        cache[key] = data
+        cache.move_to_end(key)
+        while len(cache) > IMAGE_CACHE_SIZE:
+            evicted, _ = cache.popitem(last=False)
+            self._image_validators.pop(evicted, None)
+
+    async def _async_download_image(
+        self, cache: OrderedDict[str, bytes], key: str, url: str
+    ) -> int:
+        """Download an image into a cache, revalidating the cached copy if any.
+
+        When the cached image came from the same URL, its ETag and
+        Last-Modified are sent back so an unchanged image is answered with
+        304 Not Modified and not downloaded again.
+
+        Args:
+            cache: Image cache to update
+            key: Cache key (entity ID)
+            url: Image URL
+
+        Returns:
+            HTTP status; the cache is updated on 200 and left as is otherwise
+        """
+        import aiohttp
+
+        headers: dict[str, str] = {}
+        validators = self._image_validators.get(key)
+        if validators is not None and validators[0] == url and key in cache:
+            _, etag, last_modified = validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        # Use Home Assistant's managed session for proper SSL/auth handling
+        session = async_get_clientsession(self.hass)
+        async with session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status == 200:
+                self._store_image(cache, key, await self._async_read_image(response))
+                self._image_validators[key] = (
+                    url,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+            return response.status
+
+    @staticmethod
+    async def _async_read_image(response: aiohttp.ClientResponse) -> bytes:
+        """Read an image response body, refusing bodies above the download cap.
+
+        A byte range is deliberately not requested: a truncated JPEG or PNG
+        would not decode, so oversized images are rejected instead.
+
+        Args:
+            response: Successful image response
+
+        Returns:
+            Image bytes
+
+        Raises:
+            ValueError: If the image is larger than MAX_IMAGE_DOWNLOAD_SIZE
+        """
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > MAX_IMAGE_DOWNLOAD_SIZE:
+            raise ValueError(f"Image too large ({content_length} bytes)")
+
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            size += len(chunk)
+            if size > MAX_IMAGE_DOWNLOAD_SIZE:
+                raise ValueError(f"Image larger than {MAX_IMAGE_DOWNLOAD_SIZE} bytes")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
     def get_camera_image(self, entity_id: str) -> bytes | None:
         """Get pre-fetched camera image.
 
@@ -1383,95 +1994,99 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         Fetches entity_picture URLs from media player entities and downloads
         the album art images for display.
         """
-        import aiohttp
-
         # Find all media widgets in current layout
-        media_entity_ids: set[str] = set()
-
-        if self._layouts and 0 <= self._current_screen < len(self._layouts):
-            layout = self._layouts[self._current_screen]
-            for slot in layout.slots:
-                if slot.widget and isinstance(slot.widget, MediaWidget):
-                    entity_id = slot.widget.config.entity_id
-                    if entity_id:
-                        media_entity_ids.add(entity_id)
+        media_entity_ids = self._media_entity_ids()
 
         if not media_entity_ids:
             return
 
-        # Fetch album art for each media player
-        for entity_id in media_entity_ids:
-            state = self.hass.states.get(entity_id)
-            if state is None:
-                continue
-
-            # Get entity_picture from attributes
-            entity_picture = state.attributes.get("entity_picture")
-            if not entity_picture or not entity_picture.startswith("/"):
-                # Clear any cached image if no internal picture available
-                self._media_images.pop(entity_id, None)
-                continue
+        # Pictures also needed by camera widgets or the notification are stored
+        # in both caches instead of being downloaded twice
+        _, picture_entity_ids = self._camera_image_sources()
 
-            # Use internal URL from HA config, but fall back to external_url if needed
-            base_url = self.hass.config.internal_url or getattr(
-                self.hass.config, "external_url", None
+        # Fetch album art for all media players concurrently
+        await asyncio.gather(
+            *(
+                self._async_fetch_media_image(entity_id, entity_id in picture_entity_ids)
+                for entity_id in media_entity_ids
             )
-            if not base_url:
-                continue
+        )
+
+    async def _async_fetch_media_image(self, entity_id: str, share: bool = False) -> None:
+        """Fetch the album art of one media player into the media image cache.
+
+        Args:
+            entity_id: Media player entity ID
+            share: Also store the image in the camera image cache
+        """
+        state = self.hass.states.get(entity_id)
+        if state is None:
+            return
+
+        # Get entity_picture from attributes
+        entity_picture = state.attributes.get("entity_picture")
+        if not entity_picture or not entity_picture.startswith("/"):
+            # Clear any cached image if no internal picture available
+            self._media_images.pop(entity_id, None)
+            return
 
-            # Ensure base_url doesn't have trailing slash and entity_picture has leading slash
-            image_url = f"{base_url.rstrip('/')}/{entity_picture.lstrip('/')}"
-
-            try:
-                async with (
-                    aiohttp.ClientSession() as session,
-                    session.get(image_url, timeout=aiohttp.ClientTimeout(total=10)) as response,
-                ):
-                    if response.status == 200:
-                        image_data = await response.read()
-                        self._media_images[entity_id] = image_data
-                        _LOGGER.debug(
-                            "Fetched album art for %s: %d bytes",
-                            entity_id,
-                            len(image_data),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Failed to fetch album art for %s: HTTP %d",
-                            entity_id,
-                            response.status,
-                        )
-            except Exception as e:
-                _LOGGER.debug("Failed to fetch album art for %s: %s", entity_id, e)
-
-    def _fetch_entity_history(self, entity_id: str, start: datetime, end: datetime) -> list:
-        """Fetch history for an entity (sync, runs in executor).
-
-        Uses keyword arguments for state_changes_during_period since
+        # Use internal URL from HA config, but fall back to external_url if needed
+        base_url = self.hass.config.internal_url or getattr(self.hass.config, "external_url", None)
+        if not base_url:
+            return
+
+        # Ensure base_url doesn't have trailing slash and entity_picture has leading slash
+        image_url = f"{base_url.rstrip('/')}/{entity_picture.lstrip('/')}"
+
+        try:
+            status = await self._async_download_image(self._media_images, entity_id, image_url)
+            if share and status in (200, 304) and entity_id in self._media_images:
+                self._store_image(self._camera_images, entity_id, self._media_images[entity_id])
+            if status == 200:
+                _LOGGER.debug(
+                    "Fetched album art for %s: %d bytes",
+                    entity_id,
+                    len(self._media_images[entity_id]),
+                )
+            elif status != 304:
+                _LOGGER.debug(
+                    "Failed to fetch album art for %s: HTTP %d",
+                    entity_id,
+                    status,
+                )
+        except Exception as e:
+            _LOGGER.debug("Failed to fetch album art for %s: %s", entity_id, e)
+
+    def _fetch_history(self, entity_ids: list[str], start: datetime, end: datetime) -> dict:
+        """Fetch history for several entities in one query (sync, runs in executor).
+
+        Uses keyword arguments for get_significant_states since
         async_add_executor_job passes positional args and the function
         has many optional parameters with defaults.
 
         Args:
-            entity_id: Entity ID to fetch history for
+            entity_ids: Entity IDs to fetch history for
             start: Start time (datetime)
             end: End time (datetime)
 
         Returns:
-            List of State objects for the entity
+            Dict mapping entity ID to its State objects / minimal_response dicts
         """
         from homeassistant.components.recorder import history
 
-        # state_changes_during_period returns dict[entity_id, list[State]]
-        # We need keyword arguments here since the function has many optional params
-        result = history.state_changes_during_period(
+        # Unlike state_changes_during_period, get_significant_states accepts
+        # several entity IDs; with significant_changes_only=False it returns
+        # every state change, like the per-entity query did
+        return history.get_significant_states(
             self.hass,
             start,
             end,
-            entity_id,
+            entity_ids,
             include_start_time_state=True,
+            significant_changes_only=False,
+            minimal_response=True,
             no_attributes=True,
         )
-        return result.get(entity_id, [])
 
     async def _async_fetch_chart_history(self) -> None:
         """Pre-fetch history data for all chart widgets.
@@ -1480,15 +2095,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         since recorder queries are async.
         """
         # Find all chart widgets in current layout
-        chart_widgets: list[tuple[str, ChartWidget]] = []
-
-        if self._layouts and 0 <= self._current_screen < len(self._layouts):
-            layout = self._layouts[self._current_screen]
-            for slot in layout.slots:
-                if slot.widget and isinstance(slot.widget, ChartWidget):
-                    entity_id = slot.widget.config.entity_id
-                    if entity_id:
-                        chart_widgets.append((entity_id, slot.widget))
+        chart_widgets: list[tuple[str, ChartWidget]] = self._screen_prefetch_widgets(ChartWidget)
 
         if not chart_widgets:
             return
@@ -1509,41 +2116,64 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
         now = dt_util.utcnow()
 
+        # Charts covering the same period share a single recorder query
+        entity_ids_by_hours: dict[Any, dict[str, None]] = {}
         for entity_id, widget in chart_widgets:
-            try:
-                hours = widget.hours
-                start_time = now - timedelta(hours=hours)
-
-                # Use wrapper method to fetch history with keyword arguments
-                # (async_add_executor_job only supports positional args, but
-                # state_changes_during_period needs keyword args for its many optional params)
-                history_states = await recorder.async_add_executor_job(
-                    self._fetch_entity_history,
-                    entity_id,
-                    start_time,
-                    now,
-                )
+            entity_ids_by_hours.setdefault(widget.hours, {})[entity_id] = None
+
+        await asyncio.gather(
+            *(
+                self._async_fetch_chart_history_period(recorder, list(entity_ids), hours, now)
+                for hours, entity_ids in entity_ids_by_hours.items()
+            )
+        )
+
+    async def _async_fetch_chart_history_period(
+        self, recorder: Recorder, entity_ids: list[str], hours: float, now: datetime
+    ) -> None:
+        """Fetch and store the chart history of entities sharing a period.
 
-                if history_states:
-                    values = extract_numeric_values(history_states)
-
-                    if values:
-                        # Store in coordinator for state building
-                        self._chart_history[entity_id] = values
-                        _LOGGER.debug(
-                            "Fetched %d history points for %s",
-                            len(values),
-                            entity_id,
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "No numeric values in history for %s",
-                            entity_id,
-                        )
+        Args:
+            recorder: Recorder instance used to run the history query
+            entity_ids: Entity IDs to fetch history for
+            hours: Length of the history period in hours
+            now: End of the history period
+        """
+        start_time = now - timedelta(hours=hours)
+        try:
+            # Use wrapper method to fetch history with keyword arguments
+            # (async_add_executor_job only supports positional args, but
+            # get_significant_states needs keyword args for its many optional params)
+            history_by_entity = await recorder.async_add_executor_job(
+                self._fetch_history,
+                entity_ids,
+                start_time,
+                now,
+            )
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch history for %s: %s", ", ".join(entity_ids), e)
+            return
+
+        for entity_id in entity_ids:
+            history_states = history_by_entity.get(entity_id)
+            if history_states:
+                values = extract_numeric_values(history_states)
+
+                if values:
+                    # Store in coordinator for state building
+                    self._chart_history[entity_id] = values
+                    _LOGGER.debug(
+                        "Fetched %d history points for %s",
+                        len(values),
+                        entity_id,
+                    )
                 else:
-                    _LOGGER.debug("No history returned for %s", entity_id)
-            except Exception as e:
-                _LOGGER.warning("Failed to fetch history for %s: %s", entity_id, e)
+                    _LOGGER.debug(
+                        "No numeric values in history for %s",
+                        entity_id,
+                    )
+            else:
+                _LOGGER.debug("No history returned for %s", entity_id)
 
     async def _async_fetch_weather_forecasts(self) -> None:
         """Pre-fetch forecast data for all weather widgets.
@@ -1555,39 +2185,42 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         since the forecast attribute was removed from weather entities in 2024.3.
         """
         # Find all weather widgets in current layout
-        weather_entity_ids: set[str] = set()
-
-        if self._layouts and 0 <= self._current_screen < len(self._layouts):
-            layout = self._layouts[self._current_screen]
-            for slot in layout.slots:
-                if slot.widget and isinstance(slot.widget, WeatherWidget):
-                    entity_id = slot.widget.config.entity_id
-                    if entity_id:
-                        weather_entity_ids.add(entity_id)
+        weather_entity_ids = {
+            entity_id for entity_id, _ in self._screen_prefetch_widgets(WeatherWidget)
+        }
 
         if not weather_entity_ids:
             return
 
-        # Fetch forecast for each weather entity
-        for entity_id in weather_entity_ids:
-            try:
-                # Use daily forecast type (most common for weather displays)
-                response = await self.hass.services.async_call(
-                    "weather",
-                    "get_forecasts",
-                    {"type": "daily"},
-                    target={"entity_id": entity_id},
-                    blocking=True,
-                    return_response=True,
-                )
+        # Fetch the forecasts of all weather entities concurrently
+        await asyncio.gather(
+            *(self._async_fetch_weather_forecast(entity_id) for entity_id in weather_entity_ids)
+        )
 
-                if response and entity_id in response:
-                    forecast = response[entity_id].get("forecast", [])
-                    self._weather_forecasts[entity_id] = forecast
-                    _LOGGER.debug(
-                        "Fetched %d forecast days for %s",
-                        len(forecast),
-                        entity_id,
-                    )
-            except Exception as e:
-                _LOGGER.debug("Failed to fetch forecast for %s: %s", entity_id, e)
+    async def _async_fetch_weather_forecast(self, entity_id: str) -> None:
+        """Fetch and store the daily forecast of one weather entity.
+
+        Args:
+            entity_id: Weather entity ID
+        """
+        try:
+            # Use daily forecast type (most common for weather displays)
+            response = await self.hass.services.async_call(
+                "weather",
+                "get_forecasts",
+                {"type": "daily"},
+                target={"entity_id": entity_id},
+                blocking=True,
+                return_response=True,
+            )
+
+            if response and entity_id in response:
+                forecast = response[entity_id].get("forecast", [])
+                self._weather_forecasts[entity_id] = forecast
+                _LOGGER.debug(
+                    "Fetched %d forecast days for %s",
+                    len(forecast),
+                    entity_id,
+                )
+        except Exception as e:
+            _LOGGER.debug("Failed to fetch forecast for %s: %s", entity_id, e)
@@ -14,9 +14,14 @@ from .const import MODEL_PRO, MODEL_ULTRA, MODEL_UNKNOWN
 _LOGGER = logging.getLogger(__name__)
 
 TIMEOUT = aiohttp.ClientTimeout(total=30)
+# Model detection probes, kept short so an unanswered probe does not hold up setup
+DETECT_TIMEOUT = aiohttp.ClientTimeout(total=5)
 
+# Upload content types by file extension (anything else is sent as JPEG)
+CONTENT_TYPES = {"png": "image/png", "gif": "image/gif"}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ConnectionResult:
     """Result of a connection test."""
 
@@ -31,7 +36,7 @@ class ConnectionResult:
         return self.success
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceState:
     """Represents the current device state."""
 
@@ -40,7 +45,7 @@ class DeviceState:
     current_image: str | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpaceInfo:
     """Represents device storage info."""
 
@@ -64,17 +69,30 @@ class GeekMagicDevice:
             session: Optional aiohttp session (created if not provided)
             model: Device model (MODEL_PRO, MODEL_ULTRA, or MODEL_UNKNOWN)
         """
-        # Parse and normalize the host input to handle URLs
-        if host.startswith(("http://", "https://")):
-            parsed = urlparse(host)
-            self.host = parsed.netloc  # e.g., "192.168.1.1" or "192.168.1.1:8080"
-            self.base_url = f"{parsed.scheme}://{parsed.netloc}"
-        else:
-            self.host = host
-            self.base_url = f"http://{host}"
+        # Normalize the host input to handle URLs, preserving an https scheme
+        self.host = self.normalize_host(host)
+        scheme = "https" if host.startswith("https://") else "http"
+        self.base_url = f"{scheme}://{self.host}"
         self._session = session
         self._owns_session = session is None
         self.model = model
+        # Theme last seen or set on the device; None when unknown, e.g. after
+        # a failed theme change, a button press or a reboot
+        self._theme: int | None = None
+
+    @staticmethod
+    def normalize_host(host: str) -> str:
+        """Normalize user input to the device host.
+
+        Args:
+            host: IP address, hostname, or URL of the device
+
+        Returns:
+            Host with optional port, e.g. "192.168.1.1" or "192.168.1.1:8080"
+        """
+        if host.startswith(("http://", "https://")):
+            return urlparse(host).netloc
+        return host
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create the aiohttp session."""
@@ -105,6 +123,7 @@ class GeekMagicDevice:
                 brightness=data.get("brt"),
                 current_image=data.get("img"),
             )
+            self._theme = state.theme
             _LOGGER.debug(
                 "Device state: theme=%d, brightness=%s, image=%s",
                 state.theme,
@@ -172,17 +191,22 @@ class GeekMagicDevice:
             theme: Theme number (3 = custom image on Ultra, 4 = custom image on Pro)
         """
         session = await self._get_session()
+        self._theme = None
         async with session.get(f"{self.base_url}/set?theme={theme}") as response:
             response.raise_for_status()
+        self._theme = theme
         _LOGGER.debug("Set theme to %d", theme)
 
     async def set_theme_custom(self) -> None:
         """Set device to custom image mode with the correct theme number.
 
         Ultra devices use theme 3, Pro devices use theme 4.
-        Uses the model detected at startup via detect_model().
+        Uses the model detected at startup via detect_model(). Skips the
+        request if the device is already known to be in that theme.
         """
         theme = 4 if self.model == MODEL_PRO else 3
+        if self._theme == theme:
+            return
         await self.set_theme(theme)
 
     async def set_image(self, filename: str) -> None:
@@ -206,12 +230,7 @@ class GeekMagicDevice:
             filename: Filename to save as
         """
         # Determine content type from filename
-        if filename.lower().endswith(".png"):
-            content_type = "image/png"
-        elif filename.lower().endswith(".gif"):
-            content_type = "image/gif"
-        else:
-            content_type = "image/jpeg"
+        content_type = CONTENT_TYPES.get(filename.rpartition(".")[2].lower(), "image/jpeg")
 
         # Create multipart form data
         form = aiohttp.FormData()
@@ -337,6 +356,7 @@ class GeekMagicDevice:
         Simulates pressing the right/next button on the device.
         """
         session = await self._get_session()
+        self._theme = None
         async with session.get(f"{self.base_url}/set?page=1") as response:
             response.raise_for_status()
         _LOGGER.debug("Navigated to next page")
@@ -347,6 +367,7 @@ class GeekMagicDevice:
         Simulates pressing the left/previous button on the device.
         """
         session = await self._get_session()
+        self._theme = None
         async with session.get(f"{self.base_url}/set?page=-1") as response:
             response.raise_for_status()
         _LOGGER.debug("Navigated to previous page")
@@ -357,6 +378,7 @@ class GeekMagicDevice:
         Simulates pressing the enter/menu button on the device.
         """
         session = await self._get_session()
+        self._theme = None
         async with session.get(f"{self.base_url}/set?enter=-1") as response:
             response.raise_for_status()
         _LOGGER.debug("Pressed enter button")
@@ -364,6 +386,7 @@ class GeekMagicDevice:
     async def reboot(self) -> None:
         """Reboot the device (Pro devices)."""
         session = await self._get_session()
+        self._theme = None
         async with session.get(f"{self.base_url}/set?reboot=1") as response:
             response.raise_for_status()
         _LOGGER.debug("Rebooting device")
@@ -372,14 +395,19 @@ class GeekMagicDevice:
         """Attempt to detect the device model.
 
         Pro devices use /.sys/ paths, Ultra devices use root paths.
-        Returns MODEL_PRO, MODEL_ULTRA, or MODEL_UNKNOWN.
+        Returns MODEL_PRO, MODEL_ULTRA, or MODEL_UNKNOWN. A model that is
+        already known (detected earlier or passed in) is returned without
+        probing the device.
         """
+        if self.model != MODEL_UNKNOWN:
+            return self.model
+
         session = await self._get_session()
 
         # Try Pro-specific path first (/.sys/app.json)
         try:
             async with session.get(
-                f"{self.base_url}/.sys/app.json", timeout=aiohttp.ClientTimeout(total=5)
+                f"{self.base_url}/.sys/app.json", timeout=DETECT_TIMEOUT
             ) as response:
                 if response.status == 200:
                     self.model = MODEL_PRO
@@ -390,9 +418,7 @@ class GeekMagicDevice:
 
         # Fall back to Ultra (standard path works)
         try:
-            async with session.get(
-                f"{self.base_url}/app.json", timeout=aiohttp.ClientTimeout(total=5)
-            ) as response:
+            async with session.get(f"{self.base_url}/app.json", timeout=DETECT_TIMEOUT) as response:
                 if response.status == 200:
                     self.model = MODEL_ULTRA
                     _LOGGER.info("Detected device model: SmallTV Ultra")
@@ -25,7 +25,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up GeekMagic button entities."""
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: GeekMagicCoordinator = hass.data[DOMAIN]["entries"][entry.entry_id]
 
     entities = [
         GeekMagicRefreshButton(coordinator),
@@ -26,7 +26,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up GeekMagic number entities."""
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: GeekMagicCoordinator = hass.data[DOMAIN]["entries"][entry.entry_id]
 
     entities = [
         GeekMagicBrightnessNumber(coordinator),
@@ -26,7 +26,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up GeekMagic image from a config entry."""
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: GeekMagicCoordinator = hass.data[DOMAIN]["entries"][entry.entry_id]
 
     _LOGGER.debug("Setting up GeekMagic image for %s", entry.data.get(CONF_HOST))
     async_add_entities([GeekMagicPreviewImage(hass, coordinator, entry)])
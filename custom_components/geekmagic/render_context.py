@@ -34,6 +34,10 @@ SIZE_THRESHOLD_TINY = 100
 SIZE_THRESHOLD_SMALL = 140
 SIZE_THRESHOLD_MEDIUM = 200
 
+# Size category groups for membership checks in widget render paths
+COMPACT_SIZES = frozenset({SizeCategory.MICRO, SizeCategory.TINY, SizeCategory.SMALL})
+SECONDARY_SIZES = frozenset({SizeCategory.MEDIUM, SizeCategory.LARGE})
+
 
 def get_size_category(height: int) -> SizeCategory:
     """Get size category for a given height.
@@ -157,7 +161,7 @@ class RenderContext:
         Returns:
             True for MICRO, TINY, or SMALL size categories
         """
-        return self.size_category in (SizeCategory.MICRO, SizeCategory.TINY, SizeCategory.SMALL)
+        return self.size_category in COMPACT_SIZES
 
     @property
     def show_secondary(self) -> bool:
@@ -169,7 +173,7 @@ class RenderContext:
         Returns:
             True for MEDIUM or LARGE size categories
         """
-        return self.size_category in (SizeCategory.MEDIUM, SizeCategory.LARGE)
+        return self.size_category in SECONDARY_SIZES
 
     @property
     def show_tertiary(self) -> bool:
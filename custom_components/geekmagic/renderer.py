@@ -5,12 +5,15 @@ Uses 2x supersampling for anti-aliased output.
 
 from __future__ import annotations
 
+import logging
 import math
+from collections import OrderedDict
+from functools import cache
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, features
 
 from .const import (
     COLOR_BLACK,
@@ -28,10 +31,14 @@ from .icons import get_mdi_char
 if TYPE_CHECKING:
     from PIL.ImageFont import FreeTypeFont
 
+_LOGGER = logging.getLogger(__name__)
 
 # Supersampling scale for anti-aliasing
 SUPERSAMPLE_SCALE = 2
 
+# Number of resized camera/album art images kept for reuse across frames
+RESIZED_IMAGE_CACHE_SIZE = 8
+
 # Font sizes at scaled reference height (480px)
 # These match the legacy_config in get_scaled_font for consistency
 FONT_SIZE_TINY = 38
@@ -108,11 +115,24 @@ def _load_mdi_font(size: int) -> FreeTypeFont | ImageFont.ImageFont:
         return ImageFont.load_default()
 
 
+@cache
+def _check_jpeg_encoder() -> None:
+    """Warn once if Pillow's JPEG encoder is not libjpeg-turbo.
+
+    Every refresh encodes a JPEG, and libjpeg-turbo's SIMD routines make that
+    several times faster. Official Pillow wheels bundle it; some distribution
+    builds link plain libjpeg instead.
+    """
+    if not features.check_feature("libjpeg_turbo"):
+        _LOGGER.warning("Pillow is not built with libjpeg-turbo, display rendering will be slower")
+
+
 class Renderer:
     """Renders widgets and layouts to images using PIL with supersampling."""
 
     def __init__(self) -> None:
         """Initialize the renderer with fonts."""
+        _check_jpeg_encoder()
         self.width = DISPLAY_WIDTH
         self.height = DISPLAY_HEIGHT
         self._scale = SUPERSAMPLE_SCALE
@@ -141,6 +161,13 @@ class Renderer:
         # MDI icon font cache (keyed by scaled size)
         self._mdi_font_cache: dict[int, FreeTypeFont | ImageFont.ImageFont] = {}
 
+        # Persistent canvas for repeated full-frame renders (see get_reusable_canvas)
+        self._reusable_canvas: tuple[Image.Image, ImageDraw.ImageDraw] | None = None
+        # (id(source), size) -> (source, resized); see _resize_image
+        self._resized_images: OrderedDict[
+            tuple[int, tuple[int, int]], tuple[Image.Image, Image.Image]
+        ] = OrderedDict()
+
     @property
     def scale(self) -> int:
         """Return the supersampling scale factor."""
@@ -314,10 +341,60 @@ class Renderer:
         draw = ImageDraw.Draw(img)
         return img, draw
 
+    def get_reusable_canvas(
+        self, background: tuple[int, int, int] = COLOR_BLACK
+    ) -> tuple[Image.Image, ImageDraw.ImageDraw]:
+        """Get the renderer's persistent canvas, cleared to the background color.
+
+        Unlike create_canvas(), the same image buffer and ImageDraw are
+        returned on every call, so the previous frame is overwritten. Only
+        use this when the frame is fully encoded before the next call.
+
+        Args:
+            background: RGB background color tuple
+
+        Returns:
+            Tuple of (Image, ImageDraw)
+        """
+        if self._reusable_canvas is None:
+            self._reusable_canvas = self.create_canvas(background)
+            return self._reusable_canvas
+
+        img, draw = self._reusable_canvas
+        img.paste(background, (0, 0, self._scaled_width, self._scaled_height))
+        return img, draw
+
     def _downscale(self, img: Image.Image) -> Image.Image:
         """Downscale supersampled image to final resolution with anti-aliasing."""
         return img.resize((self.width, self.height), Image.Resampling.LANCZOS)
 
+    def _resize_image(self, source: Image.Image, size: tuple[int, int]) -> Image.Image:
+        """Resize an image, reusing the result for the same source and size.
+
+        Decoded camera frames and album art are reused across refreshes, so
+        the LANCZOS resize of an unchanged image is kept in a small LRU. The
+        source is stored with its result so a recycled id() never matches.
+
+        Args:
+            source: Source PIL Image (not modified)
+            size: Target (width, height)
+
+        Returns:
+            Resized image; callers must not modify it
+        """
+        key = (id(source), size)
+        cached = self._resized_images.get(key)
+        if cached is not None and cached[0] is source:
+            self._resized_images.move_to_end(key)
+            return cached[1]
+
+        resized = source.resize(size, Image.Resampling.LANCZOS)
+        self._resized_images[key] = (source, resized)
+        self._resized_images.move_to_end(key)
+        if len(self._resized_images) > RESIZED_IMAGE_CACHE_SIZE:
+            self._resized_images.popitem(last=False)
+        return resized
+
     def draw_image(
         self,
         draw: ImageDraw.ImageDraw,
@@ -367,7 +444,7 @@ class Renderer:
             offset_y = (dest_height - new_height) // 2
 
             # Resize and paste
-            resized = source.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            resized = self._resize_image(source, (new_width, new_height))
             canvas.paste(resized, (x1 + offset_x, y1 + offset_y))
 
         elif fit_mode == "cover":
@@ -382,7 +459,7 @@ class Renderer:
                 new_height = int(dest_width / src_ratio)
 
             # Resize first
-            resized = source.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            resized = self._resize_image(source, (new_width, new_height))
 
             # Crop to center
             crop_x = (new_width - dest_width) // 2
@@ -393,7 +470,7 @@ class Renderer:
 
         else:  # stretch
             # Stretch to fill (may distort)
-            resized = source.resize((dest_width, dest_height), Image.Resampling.LANCZOS)
+            resized = self._resize_image(source, (dest_width, dest_height))
             canvas.paste(resized, (x1, y1))
 
     def draw_text(
@@ -1064,8 +1141,9 @@ class Renderer:
         if rotation:
             final_img = final_img.rotate(-rotation, expand=False)
 
+        # The preview is served locally, so favour encode speed over size
         buffer = BytesIO()
-        final_img.save(buffer, format="PNG")
+        final_img.save(buffer, format="PNG", compress_level=1)
         return buffer.getvalue()
 
     def draw_welcome_screen(self, draw: ImageDraw.ImageDraw) -> None:
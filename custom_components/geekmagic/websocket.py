@@ -469,10 +469,7 @@ async def ws_views_delete(
     await store.async_delete_view(view_id)
 
     # Remove from all device assignments
-    for key, data in hass.data[DOMAIN].items():
-        if key == "store" or not hasattr(data, "config_entry"):
-            continue
-        coordinator: GeekMagicCoordinator = data
+    for coordinator in _get_coordinators(hass).values():
         assigned = coordinator.options.get("assigned_views", [])
         if view_id in assigned:
             entry = coordinator.config_entry
@@ -529,13 +526,12 @@ def ws_devices_list(
 ) -> None:
     """Get all GeekMagic devices with their assignments."""
     devices = []
-    for key, data in hass.data.get(DOMAIN, {}).items():
-        if key == "store" or not hasattr(data, "device"):
-            continue
-        coordinator: GeekMagicCoordinator = data
+    for entry_id, coordinator in _get_coordinators(hass).items():
         devices.append(
             {
-                "entry_id": coordinator.config_entry.entry_id if coordinator.config_entry else key,
+                "entry_id": coordinator.config_entry.entry_id
+                if coordinator.config_entry
+                else entry_id,
                 "name": coordinator.device_name,
                 "host": coordinator.device.host,
                 "assigned_views": coordinator.options.get("assigned_views", []),
@@ -1002,20 +998,19 @@ def ws_entities_list(
 # =============================================================================
 
 
+def _get_coordinators(hass: HomeAssistant) -> dict[str, GeekMagicCoordinator]:
+    """Get all loaded coordinators keyed by config entry ID."""
+    return hass.data.get(DOMAIN, {}).get("entries", {})
+
+
 def _get_coordinator(hass: HomeAssistant, entry_id: str) -> GeekMagicCoordinator | None:
     """Get coordinator by entry ID."""
-    data = hass.data.get(DOMAIN, {}).get(entry_id)
-    if data and hasattr(data, "device"):
-        return data
-    return None
+    return _get_coordinators(hass).get(entry_id)
 
 
 async def _notify_coordinators_of_view_change(hass: HomeAssistant, view_id: str) -> None:
     """Notify all coordinators using a view that it changed."""
-    for key, data in hass.data.get(DOMAIN, {}).items():
-        if key == "store" or not hasattr(data, "device"):
-            continue
-        coordinator: GeekMagicCoordinator = data
+    for coordinator in _get_coordinators(hass).values():
         assigned = coordinator.options.get("assigned_views", [])
         if view_id in assigned:
             # Reload views from store and refresh display
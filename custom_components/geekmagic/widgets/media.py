@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from PIL import Image
 
 from ..const import COLOR_CYAN
-from ..render_context import SizeCategory, get_size_category
+from ..render_context import COMPACT_SIZES, SECONDARY_SIZES, SizeCategory, get_size_category
 from .base import Widget, WidgetConfig
 from .components import (
     THEME_TEXT_PRIMARY,
@@ -154,8 +154,8 @@ class AlbumArt(Component):
         # Determine sizing based on available space using standard size categories
         size = get_size_category(height)
         is_micro = size == SizeCategory.MICRO
-        is_compact = size in (SizeCategory.MICRO, SizeCategory.TINY, SizeCategory.SMALL)
-        show_artist = size in (SizeCategory.MEDIUM, SizeCategory.LARGE)
+        is_compact = size in COMPACT_SIZES
+        show_artist = size in SECONDARY_SIZES
         show_time = size == SizeCategory.LARGE
 
         # Overlay ratio varies by size - smaller for small cells
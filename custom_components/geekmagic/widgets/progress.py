@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, ClassVar
 
 from ..const import COLOR_CYAN, COLOR_DARK_GRAY
-from ..render_context import SizeCategory, get_size_category
+from ..render_context import SECONDARY_SIZES, SizeCategory, get_size_category
 from .base import Widget, WidgetConfig
 from .components import (
     THEME_TEXT_PRIMARY,
@@ -82,7 +82,7 @@ class ProgressDisplay(Component):
         # Expanded: MEDIUM/LARGE cells, vertical layout with icon/label separate from value
         size = get_size_category(height)
         is_compact = size == SizeCategory.MICRO
-        is_expanded = size in (SizeCategory.MEDIUM, SizeCategory.LARGE)
+        is_expanded = size in SECONDARY_SIZES
 
         if is_expanded:
             # Expanded: icon + label on top, value below, bar + percent at bottom
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from PIL import Image
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityState:
     """Immutable snapshot of a Home Assistant entity state.
 
@@ -51,7 +51,7 @@ class EntityState:
         return self.attributes.get(key, default)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WidgetState:
     """All state a widget needs to render, injected by coordinator.
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from ..const import COLOR_LIME, COLOR_RED, PLACEHOLDER_NAME
-from ..render_context import SizeCategory, get_size_category
+from ..render_context import SECONDARY_SIZES, get_size_category
 from .base import Widget, WidgetConfig
 from .components import (
     THEME_TEXT_PRIMARY,
@@ -56,7 +56,7 @@ class StatusIndicator(Component):
         status_text = self.on_text if self.is_on else self.off_text
 
         # Use vertical layout with prominent icon for larger cells
-        if size in (SizeCategory.MEDIUM, SizeCategory.LARGE) and self.icon:
+        if size in SECONDARY_SIZES and self.icon:
             self._render_vertical(ctx, x, y, width, height, color, status_text)
         else:
             self._render_horizontal(ctx, x, y, width, height, color, status_text)
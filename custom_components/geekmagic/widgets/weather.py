@@ -10,7 +10,7 @@ from ..const import (
     COLOR_CYAN,
     COLOR_GOLD,
 )
-from ..render_context import SizeCategory, get_size_category
+from ..render_context import SECONDARY_SIZES, SizeCategory, get_size_category
 from .base import Widget, WidgetConfig
 from .components import (
     THEME_TEXT_PRIMARY,
@@ -101,7 +101,7 @@ class WeatherDisplay(Component):
         # Use standard size categories for responsive layout
         size = get_size_category(height)
 
-        if size in (SizeCategory.MEDIUM, SizeCategory.LARGE) and self.show_forecast:
+        if size in SECONDARY_SIZES and self.show_forecast:
             # Full layout with detailed forecast
             component = self._build_full(ctx, width, height, icon_name)
         elif size == SizeCategory.SMALL and self.show_forecast and self.forecast:
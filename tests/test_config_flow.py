@@ -9,6 +9,7 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.geekmagic.config_flow import (
     GeekMagicConfigFlow,
@@ -25,7 +26,7 @@ from custom_components.geekmagic.const import (
     DOMAIN,
     LAYOUT_GRID_2X2,
 )
-from custom_components.geekmagic.device import ConnectionResult
+from custom_components.geekmagic.device import ConnectionResult, GeekMagicDevice
 
 
 class TestConfigFlowImports:
@@ -67,6 +68,7 @@ class TestConfigFlowUser:
             patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
         ):
             mock_get_session.return_value = AsyncMock()
+            mock_device_class.normalize_host.side_effect = GeekMagicDevice.normalize_host
             mock_device = mock_device_class.return_value
             mock_device.host = "192.168.1.100"
             mock_device.test_connection = AsyncMock(
@@ -84,6 +86,38 @@ class TestConfigFlowUser:
 
         await hass.async_block_till_done()
 
+    @pytest.mark.asyncio
+    async def test_user_flow_resubmit_reuses_recent_failure(self, hass):
+        """Test resubmitting a host that just failed does not probe it again."""
+        with (
+            patch(
+                "custom_components.geekmagic.config_flow.async_get_clientsession"
+            ) as mock_get_session,
+            patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
+        ):
+            mock_get_session.return_value = AsyncMock()
+            mock_device_class.normalize_host.side_effect = GeekMagicDevice.normalize_host
+            mock_device = mock_device_class.return_value
+            mock_device.host = "192.168.1.100"
+            mock_device.test_connection = AsyncMock(
+                return_value=ConnectionResult(
+                    success=False, error="timeout", message="Connection timed out"
+                )
+            )
+
+            result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
+            for host in ("192.168.1.100", "http://192.168.1.100"):
+                result = await hass.config_entries.flow.async_configure(
+                    result["flow_id"],
+                    user_input={"host": host, "name": "Test Display"},
+                )
+                assert result["type"] == FlowResultType.FORM
+                assert result["errors"] == {"base": "timeout"}
+
+            mock_device.test_connection.assert_awaited_once()
+
+        await hass.async_block_till_done()
+
     @pytest.mark.asyncio
     async def test_user_flow_connection_timeout(self, hass):
         """Test user flow shows timeout error."""
@@ -94,6 +128,7 @@ class TestConfigFlowUser:
             patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
         ):
             mock_get_session.return_value = AsyncMock()
+            mock_device_class.normalize_host.side_effect = GeekMagicDevice.normalize_host
             mock_device = mock_device_class.return_value
             mock_device.host = "192.168.1.100"
             mock_device.test_connection = AsyncMock(
@@ -123,6 +158,7 @@ class TestConfigFlowUser:
             patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
         ):
             mock_get_session.return_value = AsyncMock()
+            mock_device_class.normalize_host.side_effect = GeekMagicDevice.normalize_host
             mock_device = mock_device_class.return_value
             mock_device.host = "invalid.hostname"
             mock_device.test_connection = AsyncMock(
@@ -152,6 +188,7 @@ class TestConfigFlowUser:
             patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
         ):
             mock_get_session.return_value = AsyncMock()
+            mock_device_class.normalize_host.side_effect = GeekMagicDevice.normalize_host
             mock_device = mock_device_class.return_value
             mock_device.host = "192.168.1.100"
             mock_device.test_connection = AsyncMock(
@@ -186,6 +223,7 @@ class TestConfigFlowUser:
             ),
         ):
             mock_get_session.return_value = AsyncMock()
+            mock_device_class.normalize_host.side_effect = GeekMagicDevice.normalize_host
             mock_device = mock_device_class.return_value
             mock_device.host = "192.168.1.100"
             mock_device.test_connection = AsyncMock(return_value=ConnectionResult(success=True))
@@ -221,6 +259,7 @@ class TestConfigFlowUser:
             ),
         ):
             mock_get_session.return_value = AsyncMock()
+            mock_device_class.normalize_host.side_effect = GeekMagicDevice.normalize_host
             mock_device = mock_device_class.return_value
             # Simulating what happens when user enters a URL - device.host is normalized
             mock_device.host = "192.168.1.100"
@@ -241,6 +280,33 @@ class TestConfigFlowUser:
 
         await hass.async_block_till_done()
 
+    @pytest.mark.asyncio
+    async def test_user_flow_duplicate_aborts_before_connecting(self, hass):
+        """Test an already-configured host aborts without a connection test."""
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={"host": "192.168.1.100"},
+            unique_id="192.168.1.100",
+        ).add_to_hass(hass)
+
+        with (
+            patch("custom_components.geekmagic.config_flow.async_get_clientsession"),
+            patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
+        ):
+            mock_device_class.normalize_host.side_effect = GeekMagicDevice.normalize_host
+            mock_device = mock_device_class.return_value
+            mock_device.test_connection = AsyncMock()
+
+            result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                user_input={"host": "http://192.168.1.100", "name": "Test Display"},
+            )
+
+            assert result["type"] == FlowResultType.ABORT
+            assert result["reason"] == "already_configured"
+            mock_device.test_connection.assert_not_called()
+
 
 class TestOptionsFlowInit:
     """Test options flow initialization."""
@@ -269,3 +335,12 @@ class TestDefaultOptions:
         assert defaults[CONF_SCREENS][0][CONF_LAYOUT] == LAYOUT_GRID_2X2
         assert len(defaults[CONF_SCREENS][0][CONF_WIDGETS]) == 1
         assert defaults[CONF_SCREENS][0][CONF_WIDGETS][0]["type"] == "clock"
+
+    def test_get_default_options_returns_independent_copies(self):
+        """Test mutating returned defaults does not leak into later calls."""
+        flow = GeekMagicConfigFlow()
+        defaults = flow._get_default_options()
+        defaults[CONF_SCREENS][0][CONF_WIDGETS].append({"type": "text", "slot": 1})
+
+        fresh = flow._get_default_options()
+        assert len(fresh[CONF_SCREENS][0][CONF_WIDGETS]) == 1
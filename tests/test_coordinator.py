@@ -1,5 +1,6 @@
 """Tests for GeekMagic coordinator multi-screen support."""
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -17,7 +18,11 @@ from custom_components.geekmagic.const import (
     LAYOUT_SPLIT_H,
     MAX_BACKOFF_MULTIPLIER,
 )
-from custom_components.geekmagic.coordinator import GeekMagicCoordinator
+from custom_components.geekmagic.coordinator import (
+    IMAGE_CACHE_SIZE,
+    UNCHANGED_UPLOAD_INTERVAL,
+    GeekMagicCoordinator,
+)
 from custom_components.geekmagic.device import ConnectionResult
 
 
@@ -162,6 +167,435 @@ class TestCoordinatorUpdateOptions:
         coordinator.update_options(new_options)
 
         assert coordinator.screen_count == 3
+        assert coordinator.current_screen_name == "Screen 1"
+        assert coordinator.update_interval == timedelta(seconds=10)
+
+    def test_update_options_reuses_unchanged_widgets(self, hass, coordinator_device):
+        """Test rebuilding screens keeps widgets whose config did not change."""
+        options = {
+            CONF_REFRESH_INTERVAL: 10,
+            CONF_SCREENS: [
+                {
+                    "name": "Screen 1",
+                    CONF_LAYOUT: LAYOUT_GRID_2X2,
+                    CONF_WIDGETS: [
+                        {"type": "clock", "slot": 0, "options": {"show_seconds": True}},
+                        {"type": "entity", "slot": 1, "entity_id": "sensor.temp"},
+                    ],
+                }
+            ],
+        }
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
+        clock, entity = (slot.widget for slot in coordinator._layouts[0].slots[:2])
+
+        options[CONF_SCREENS][0][CONF_WIDGETS][1]["entity_id"] = "sensor.other"
+        coordinator.update_options(options)
+
+        slots = coordinator._layouts[0].slots
+        assert slots[0].widget is clock
+        assert slots[1].widget is not entity
+        assert slots[1].widget.config.entity_id == "sensor.other"
+
+    def test_welcome_layout_reused_with_current_entity_count(self, hass, coordinator_device):
+        """Test the welcome layout is built once and its entity count kept current."""
+        coordinator = GeekMagicCoordinator(
+            hass, coordinator_device, {CONF_REFRESH_INTERVAL: 10, CONF_SCREENS: []}
+        )
+
+        first = coordinator._get_welcome_layout(3)
+        second = coordinator._get_welcome_layout(7)
+
+        assert second is first
+        assert second.slots[2].widget.text == "7"
+
+
+class TestCoordinatorRenderCache:
+    """Test reuse of rendered frames when display content is unchanged."""
+
+    @pytest.fixture
+    def entity_options(self):
+        """Create options with a single entity widget."""
+        return {
+            CONF_REFRESH_INTERVAL: 10,
+            CONF_SCREENS: [
+                {
+                    "name": "Screen 1",
+                    CONF_LAYOUT: LAYOUT_GRID_2X2,
+                    CONF_WIDGETS: [{"type": "entity", "slot": 0, "entity_id": "sensor.temp"}],
+                }
+            ],
+        }
+
+    @staticmethod
+    def _spy_renderer(coordinator):
+        renderer = coordinator.renderer
+        renderer.get_reusable_canvas = MagicMock(wraps=renderer.get_reusable_canvas)
+        renderer.to_jpeg = MagicMock(wraps=renderer.to_jpeg)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_reuses_frame(self, hass, coordinator_device, entity_options):
+        """Test a second render with identical content skips drawing."""
+        hass.states.async_set("sensor.temp", "21")
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, entity_options)
+        self._spy_renderer(coordinator)
+
+        first = coordinator._render_display()
+        assert coordinator._render_display() is first
+
+        coordinator.renderer.get_reusable_canvas.assert_called_once()
+        coordinator.renderer.to_jpeg.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_state_change_renders_again(self, hass, coordinator_device, entity_options):
+        """Test an entity state change invalidates the cached frame."""
+        hass.states.async_set("sensor.temp", "21")
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, entity_options)
+        self._spy_renderer(coordinator)
+
+        coordinator._render_display()
+        hass.states.async_set("sensor.temp", "22")
+        coordinator._render_display()
+
+        assert coordinator.renderer.get_reusable_canvas.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_options_clears_cache(self, hass, coordinator_device, entity_options):
+        """Test rebuilding screens drops frames cached for the old layouts."""
+        hass.states.async_set("sensor.temp", "21")
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, entity_options)
+        self._spy_renderer(coordinator)
+
+        coordinator._render_display()
+        coordinator.update_options(entity_options)
+        coordinator._render_display()
+
+        assert coordinator.renderer.get_reusable_canvas.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_png_only_encoded_when_requested(self, hass, coordinator_device, entity_options):
+        """Test the preview PNG is skipped unless asked for, even on cache hits."""
+        hass.states.async_set("sensor.temp", "21")
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, entity_options)
+        self._spy_renderer(coordinator)
+        coordinator.renderer.to_png = MagicMock(wraps=coordinator.renderer.to_png)
+
+        jpeg_data, png_data = coordinator._render_display()
+        assert jpeg_data
+        assert png_data is None
+        coordinator.renderer.to_png.assert_not_called()
+
+        _, png_data = coordinator._render_display(include_png=True)
+        assert png_data is not None
+        coordinator.renderer.to_png.assert_called_once()
+
+
+class TestCoordinatorChangeTracking:
+    """Test skipping renders when no tracked entity changed."""
+
+    @pytest.fixture
+    def tracking_device(self, coordinator_device):
+        """Create mock device that answers state polls."""
+        coordinator_device.get_brightness = AsyncMock(return_value=50)
+        coordinator_device.get_state = AsyncMock(return_value=None)
+        coordinator_device.get_space = AsyncMock(return_value=None)
+        return coordinator_device
+
+    @staticmethod
+    def _options(widget):
+        return {
+            CONF_REFRESH_INTERVAL: 10,
+            CONF_SCREENS: [
+                {"name": "Screen 1", CONF_LAYOUT: LAYOUT_GRID_2X2, CONF_WIDGETS: [widget]}
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_unchanged_entities_skip_render(self, hass, tracking_device):
+        """Test refreshes reuse the last frame until a tracked entity changes."""
+        hass.states.async_set("sensor.temp", "21")
+        options = self._options({"type": "entity", "slot": 0, "entity_id": "sensor.temp"})
+        coordinator = GeekMagicCoordinator(hass, tracking_device, options)
+
+        with patch.object(
+            coordinator, "_render_display", return_value=(b"jpeg", b"png")
+        ) as mock_render:
+            await coordinator._async_update_data()
+            await coordinator._async_update_data()
+            assert mock_render.call_count == 1
+
+            hass.states.async_set("sensor.temp", "22")
+            await hass.async_block_till_done()
+            await coordinator._async_update_data()
+            assert mock_render.call_count == 2
+
+        # The rendered bytes never changed, so only the first frame was uploaded
+        assert tracking_device.upload_and_display.await_count == 1
+        # Storage info is only polled on the first update and then every 10 minutes
+        assert tracking_device.get_space.await_count == 1
+        await coordinator.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_frame_uploaded_again_after_interval(self, hass, tracking_device):
+        """Test an unchanged frame is re-uploaded once the upload interval passed."""
+        coordinator = GeekMagicCoordinator(
+            hass, tracking_device, self._options({"type": "clock", "slot": 0})
+        )
+
+        with patch.object(coordinator, "_render_display", return_value=(b"jpeg", b"png")):
+            await coordinator._async_update_data()
+            await coordinator._async_update_data()
+            assert tracking_device.upload_and_display.await_count == 1
+
+            coordinator._last_upload_at -= UNCHANGED_UPLOAD_INTERVAL
+            await coordinator._async_update_data()
+
+        assert tracking_device.upload_and_display.await_count == 2
+        await coordinator.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_device_polls_fail_independently(self, hass, tracking_device):
+        """Test a failing state request does not prevent the other device polls."""
+        tracking_device.get_state = AsyncMock(side_effect=TimeoutError)
+        tracking_device.get_space = AsyncMock(return_value=MagicMock(total=100, free=40))
+        coordinator = GeekMagicCoordinator(
+            hass, tracking_device, self._options({"type": "clock", "slot": 0})
+        )
+
+        with patch.object(coordinator, "_render_display", return_value=(b"jpeg", b"png")):
+            await coordinator._async_update_data()
+
+        assert coordinator._device_brightness == 50
+        assert coordinator._space_info is tracking_device.get_space.return_value
+        await coordinator.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_slow_upload_times_out(self, hass, tracking_device):
+        """Test a hanging upload marks the device offline and backs off until it answers."""
+        from homeassistant.helpers.update_coordinator import UpdateFailed
+
+        async def _slow_upload(*_args):
+            await asyncio.sleep(1)
+
+        tracking_device.upload_and_display = AsyncMock(side_effect=_slow_upload)
+        tracking_device.test_connection = AsyncMock(side_effect=TimeoutError)
+        coordinator = GeekMagicCoordinator(
+            hass, tracking_device, self._options({"type": "clock", "slot": 0})
+        )
+
+        with (
+            patch("custom_components.geekmagic.coordinator.UPLOAD_TIMEOUT", 0.01),
+            patch.object(coordinator, "_render_display", return_value=(b"jpeg", b"png")),
+        ):
+            with pytest.raises(UpdateFailed, match="Upload timed out"):
+                await coordinator._async_update_data()
+            assert coordinator.last_update_success is False
+            assert coordinator._device_offline is True
+            assert coordinator._consecutive_failures == 1
+            assert coordinator.update_interval == timedelta(seconds=20)
+
+            # Still not answering: only the connectivity check runs, backoff grows
+            with pytest.raises(UpdateFailed, match="Device offline"):
+                await coordinator._async_update_data()
+            assert coordinator._consecutive_failures == 2
+            assert coordinator.update_interval == timedelta(seconds=40)
+            assert tracking_device.upload_and_display.await_count == 1
+
+            # Once the device answers again, the timed out frame is uploaded again
+            tracking_device.test_connection = AsyncMock(
+                return_value=ConnectionResult(success=True, error=None, message="OK")
+            )
+            tracking_device.upload_and_display = AsyncMock()
+            result = await coordinator._async_update_data()
+
+        assert result["success"] is True
+        assert coordinator._device_offline is False
+        tracking_device.upload_and_display.assert_awaited_once_with(b"jpeg", "dashboard.jpg")
+        await coordinator.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skipped_without_prefetched_widgets(self, hass, tracking_device):
+        """Test screens without camera/media/chart/weather widgets skip the pre-fetch."""
+        coordinator = GeekMagicCoordinator(
+            hass, tracking_device, self._options({"type": "clock", "slot": 0})
+        )
+
+        with (
+            patch.object(coordinator, "_render_display", return_value=(b"jpeg", b"png")),
+            patch.object(coordinator, "_async_fetch_chart_history") as mock_fetch,
+        ):
+            await coordinator._async_update_data()
+            mock_fetch.assert_not_called()
+
+            coordinator._notification_data = {"image": "camera.door"}
+            await coordinator._async_update_data()
+            mock_fetch.assert_called_once()
+
+        await coordinator.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_time_driven_widgets_always_render(self, hass, tracking_device):
+        """Test screens with a clock render on every refresh."""
+        coordinator = GeekMagicCoordinator(
+            hass, tracking_device, self._options({"type": "clock", "slot": 0})
+        )
+
+        with patch.object(
+            coordinator, "_render_display", return_value=(b"jpeg", b"png")
+        ) as mock_render:
+            await coordinator._async_update_data()
+            await coordinator._async_update_data()
+
+        assert mock_render.call_count == 2
+        await coordinator.async_shutdown()
+
+    def test_widget_states_rebuilt_only_for_changed_entities(self, hass, coordinator_device):
+        """Test screen widget states are reused until one of their entities changes."""
+        hass.states.async_set("sensor.temp", "21")
+        hass.states.async_set("sensor.humidity", "40")
+        options = self._options({"type": "entity", "slot": 0, "entity_id": "sensor.temp"})
+        options[CONF_SCREENS][0][CONF_WIDGETS].append(
+            {"type": "entity", "slot": 1, "entity_id": "sensor.humidity"}
+        )
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
+        layout = coordinator._layouts[0]
+
+        first = coordinator._build_widget_states(layout, reuse_states=True)
+        hass.states.async_set("sensor.temp", "22")
+        second = coordinator._build_widget_states(layout, reuse_states=True)
+
+        assert second[0] is not first[0]
+        assert second[0].entity.state == "22"
+        assert second[1] is first[1]
+
+
+class TestCoordinatorDecodedImages:
+    """Test decoding of pre-fetched camera/media images."""
+
+    def test_decode_image_reuses_unchanged_bytes(
+        self, hass, coordinator_device, old_format_options
+    ):
+        """Test identical image bytes are decoded once and returned as RGB."""
+        from io import BytesIO
+
+        from PIL import Image
+
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, old_format_options)
+        buffer = BytesIO()
+        Image.new("RGBA", (4, 4), (255, 0, 0, 128)).save(buffer, format="PNG")
+
+        image = coordinator._decode_image(buffer.getvalue())
+
+        assert image is not None
+        assert image.mode == "RGB"
+        assert coordinator._decode_image(bytes(buffer.getvalue())) is image
+
+    def test_decode_image_scales_down_large_jpeg(
+        self, hass, coordinator_device, old_format_options
+    ):
+        """Test large JPEGs are decoded at a reduced scale that still covers the canvas."""
+        from io import BytesIO
+
+        from PIL import Image
+
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, old_format_options)
+        buffer = BytesIO()
+        Image.new("RGB", (2000, 2000), (0, 128, 255)).save(buffer, format="JPEG")
+
+        image = coordinator._decode_image(buffer.getvalue())
+
+        assert image is not None
+        assert 480 <= image.width < 2000
+        assert 480 <= image.height < 2000
+
+    def test_decode_image_invalid_bytes(self, hass, coordinator_device, old_format_options):
+        """Test undecodable bytes yield no image."""
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, old_format_options)
+
+        assert coordinator._decode_image(b"not an image") is None
+
+
+class TestCoordinatorImageDownloads:
+    """Test downloading of entity pictures and album art."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_image_is_revalidated(
+        self, hass, coordinator_device, old_format_options, aioclient_mock
+    ):
+        """Test a cached image is revalidated with its ETag instead of re-downloaded."""
+        url = "http://homeassistant.local/api/media_player_proxy/media_player.tv"
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, old_format_options)
+        cache = coordinator._media_images
+
+        aioclient_mock.get(url, content=b"art", headers={"ETag": '"v1"'})
+        status = await coordinator._async_download_image(cache, "media_player.tv", url)
+        assert status == 200
+        assert cache["media_player.tv"] == b"art"
+
+        aioclient_mock.clear_requests()
+        aioclient_mock.get(url, status=304)
+        status = await coordinator._async_download_image(cache, "media_player.tv", url)
+
+        assert status == 304
+        assert cache["media_player.tv"] == b"art"
+        assert aioclient_mock.mock_calls[-1][3]["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_oversized_image_is_rejected(
+        self, hass, coordinator_device, old_format_options, aioclient_mock
+    ):
+        """Test images above the download cap are not stored."""
+        url = "http://homeassistant.local/api/image_proxy/image.big"
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, old_format_options)
+        aioclient_mock.get(url, content=b"0123456789")
+
+        with (
+            patch("custom_components.geekmagic.coordinator.MAX_IMAGE_DOWNLOAD_SIZE", 4),
+            pytest.raises(ValueError, match="Image"),
+        ):
+            await coordinator._async_download_image(coordinator._camera_images, "image.big", url)
+
+        assert "image.big" not in coordinator._camera_images
+
+    @pytest.mark.asyncio
+    async def test_shared_picture_downloaded_once(self, hass, coordinator_device, aioclient_mock):
+        """Test a picture used by camera and media widgets is fetched only once."""
+        hass.config.internal_url = "http://homeassistant.local:8123"
+        hass.states.async_set("media_player.tv", "playing", {"entity_picture": "/api/art/tv"})
+        options = {
+            CONF_REFRESH_INTERVAL: 10,
+            CONF_SCREENS: [
+                {
+                    "name": "Screen 1",
+                    CONF_LAYOUT: LAYOUT_GRID_2X2,
+                    CONF_WIDGETS: [
+                        {"type": "camera", "slot": 0, "entity_id": "media_player.tv"},
+                        {"type": "media", "slot": 1, "entity_id": "media_player.tv"},
+                    ],
+                }
+            ],
+        }
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
+        aioclient_mock.get("http://homeassistant.local:8123/api/art/tv", content=b"art")
+
+        await asyncio.gather(
+            coordinator._async_fetch_camera_images(), coordinator._async_fetch_media_images()
+        )
+
+        assert aioclient_mock.call_count == 1
+        assert coordinator._media_images["media_player.tv"] == b"art"
+        assert coordinator._camera_images["media_player.tv"] == b"art"
+
+    def test_image_cache_is_bounded(self, hass, coordinator_device, old_format_options):
+        """Test the least recently stored images are evicted past the cache size."""
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, old_format_options)
+        cache = coordinator._camera_images
+
+        for i in range(IMAGE_CACHE_SIZE + 1):
+            coordinator._store_image(cache, f"image.{i}", b"data")
+
+        assert len(cache) == IMAGE_CACHE_SIZE
+        assert "image.0" not in cache
+        assert f"image.{IMAGE_CACHE_SIZE}" in cache
 
 
 class TestCoordinatorWidgetRegistration:
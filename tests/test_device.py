@@ -98,6 +98,19 @@ class TestGeekMagicDevice:
         assert device.host == "geekmagic.local"
         assert device.base_url == "http://geekmagic.local"
 
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("192.168.1.100", "192.168.1.100"),
+            ("http://192.168.1.100", "192.168.1.100"),
+            ("https://192.168.1.100:8443/", "192.168.1.100:8443"),
+            ("geekmagic.local", "geekmagic.local"),
+        ],
+    )
+    def test_normalize_host(self, raw, expected):
+        """Test host normalization without creating a device."""
+        assert GeekMagicDevice.normalize_host(raw) == expected
+
     def test_init_with_session(self, mock_session):
         """Test device initialization with provided session."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -181,6 +194,22 @@ class TestGeekMagicDevice:
         assert "theme=3" in str(calls[0])
         assert "img=/image/dashboard.jpg" in str(calls[1])
 
+    @pytest.mark.asyncio
+    async def test_set_image_skips_known_custom_theme(self, mock_session, mock_response):
+        """Test the theme is only switched while the device may not be in custom mode."""
+        device = GeekMagicDevice("192.168.1.100", session=mock_session)
+        await device.set_image("dashboard.jpg")
+        await device.set_image("dashboard.jpg")
+
+        calls = mock_session.get.call_args_list
+        assert len(calls) == 3
+        assert "img=/image/dashboard.jpg" in str(calls[2])
+
+        # A button press may leave the custom image, so the theme is set again
+        await device.navigate_next()
+        await device.set_image("dashboard.jpg")
+        assert "theme=3" in str(mock_session.get.call_args_list[4])
+
     @pytest.mark.asyncio
     async def test_upload(self, mock_session, mock_response):
         """Test uploading an image."""
@@ -450,6 +479,19 @@ class TestDeviceModelDetection:
         assert result == MODEL_ULTRA
         assert device.model == MODEL_ULTRA
 
+    @pytest.mark.asyncio
+    async def test_detect_model_known_skips_probe(self, mock_session):
+        """Test a model passed in (e.g. stored in the config entry) is not probed again."""
+        from custom_components.geekmagic.const import MODEL_PRO
+
+        mock_session.get = MagicMock()
+
+        device = GeekMagicDevice("192.168.1.100", session=mock_session, model=MODEL_PRO)
+        result = await device.detect_model()
+
+        assert result == MODEL_PRO
+        mock_session.get.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_navigate_next(self, mock_session):
         """Test Pro navigate next."""
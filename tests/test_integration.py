@@ -1,5 +1,6 @@
 """Integration tests for GeekMagic."""
 
+import asyncio
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -37,13 +38,14 @@ class TestIntegrationSetup:
         with patch("custom_components.geekmagic.async_get_clientsession") as mock_session:
             mock_session.return_value = MagicMock()
 
-            with patch("custom_components.geekmagic.GeekMagicDevice") as mock_device_class:
+            with patch("custom_components.geekmagic.device.GeekMagicDevice") as mock_device_class:
                 mock_device = MagicMock()
                 # Return a ConnectionResult with success=False and a message
                 connection_result = ConnectionResult(
                     success=False, error="timeout", message="Connection timed out"
                 )
                 mock_device.test_connection = AsyncMock(return_value=connection_result)
+                mock_device.detect_model = AsyncMock(return_value="unknown")
                 mock_device_class.return_value = mock_device
 
                 # Should raise ConfigEntryNotReady for automatic retry
@@ -61,14 +63,14 @@ class TestIntegrationSetup:
         with patch("custom_components.geekmagic.async_get_clientsession") as mock_session:
             mock_session.return_value = MagicMock()
 
-            with patch("custom_components.geekmagic.GeekMagicDevice") as mock_device_class:
+            with patch("custom_components.geekmagic.device.GeekMagicDevice") as mock_device_class:
                 mock_device = MagicMock()
                 mock_device.test_connection = AsyncMock(return_value=True)
                 mock_device.detect_model = AsyncMock(return_value="ultra")
                 mock_device_class.return_value = mock_device
 
                 with patch(
-                    "custom_components.geekmagic.GeekMagicCoordinator"
+                    "custom_components.geekmagic.coordinator.GeekMagicCoordinator"
                 ) as mock_coordinator_class:
                     mock_coordinator = MagicMock()
                     mock_coordinator.async_config_entry_first_refresh = AsyncMock()
@@ -84,7 +86,98 @@ class TestIntegrationSetup:
 
                         assert result is True
                         assert DOMAIN in hass.data
-                        assert integration_entry.entry_id in hass.data[DOMAIN]
+                        assert integration_entry.entry_id in hass.data[DOMAIN]["entries"]
+                        # Device registry id is mapped to the coordinator for notify
+                        device_coordinators = hass.data[DOMAIN]["device_coordinators"]
+                        assert list(device_coordinators.values()) == [mock_coordinator]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_setup_entries_run_domain_setup_once(self, hass):
+        """Test entries set up concurrently share a single async_setup call."""
+        entries = [
+            MockConfigEntry(
+                domain=DOMAIN,
+                title=f"Display {i}",
+                data={"host": f"192.168.1.{100 + i}"},
+                options={},
+                entry_id=f"concurrent_entry_{i}",
+            )
+            for i in range(2)
+        ]
+        for entry in entries:
+            entry.add_to_hass(hass)
+
+        async def fake_domain_setup(hass, config):
+            hass.data.setdefault(DOMAIN, {})
+            await asyncio.sleep(0)  # Yield so the other entry can race
+            return True
+
+        with (
+            patch(
+                "custom_components.geekmagic.async_setup", side_effect=fake_domain_setup
+            ) as mock_setup,
+            patch("custom_components.geekmagic.async_get_clientsession"),
+            patch("custom_components.geekmagic.device.GeekMagicDevice") as mock_device_class,
+            patch(
+                "custom_components.geekmagic.coordinator.GeekMagicCoordinator"
+            ) as mock_coordinator_class,
+            patch.object(
+                hass.config_entries,
+                "async_forward_entry_setups",
+                new=AsyncMock(return_value=True),
+            ),
+        ):
+            mock_device = MagicMock()
+            mock_device.test_connection = AsyncMock(return_value=True)
+            mock_device.detect_model = AsyncMock(return_value="ultra")
+            mock_device_class.return_value = mock_device
+            mock_coordinator_class.return_value.async_config_entry_first_refresh = AsyncMock()
+
+            results = await asyncio.gather(*(async_setup_entry(hass, e) for e in entries))
+
+        assert results == [True, True]
+        mock_setup.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_domain_setup_is_retried(self, hass, integration_entry):
+        """Test a failed async_setup does not stick for later entry setup retries."""
+        integration_entry.add_to_hass(hass)
+        attempts = 0
+
+        async def flaky_domain_setup(hass, config):
+            nonlocal attempts
+            attempts += 1
+            domain_data = hass.data.setdefault(DOMAIN, {})
+            if attempts == 1:
+                raise OSError("store not readable")
+            domain_data["store"] = MagicMock()
+            return True
+
+        with (
+            patch("custom_components.geekmagic.async_setup", side_effect=flaky_domain_setup),
+            patch("custom_components.geekmagic.async_get_clientsession"),
+            patch("custom_components.geekmagic.device.GeekMagicDevice") as mock_device_class,
+            patch("custom_components.geekmagic.coordinator.GeekMagicCoordinator") as mock_coord,
+            patch.object(
+                hass.config_entries,
+                "async_forward_entry_setups",
+                new=AsyncMock(return_value=True),
+            ),
+        ):
+            mock_device = MagicMock()
+            mock_device.test_connection = AsyncMock(return_value=True)
+            mock_device.detect_model = AsyncMock(return_value="ultra")
+            mock_device_class.return_value = mock_device
+            mock_coord.return_value.async_config_entry_first_refresh = AsyncMock()
+
+            with pytest.raises(OSError, match="store not readable"):
+                await async_setup_entry(hass, integration_entry)
+            assert DOMAIN not in hass.data
+
+            assert await async_setup_entry(hass, integration_entry) is True
+
+        assert attempts == 2
+        assert "store" in hass.data[DOMAIN]
 
 
 class TestIntegrationUnload:
@@ -106,7 +199,7 @@ class TestIntegrationUnload:
         """Test successful unload removes coordinator."""
         unload_entry.add_to_hass(hass)
         # Set up the data structure as if setup was called
-        hass.data[DOMAIN] = {unload_entry.entry_id: MagicMock()}
+        hass.data[DOMAIN] = {"entries": {unload_entry.entry_id: MagicMock()}}
 
         with patch.object(
             hass.config_entries, "async_unload_platforms", new=AsyncMock(return_value=True)
@@ -114,14 +207,14 @@ class TestIntegrationUnload:
             result = await async_unload_entry(hass, unload_entry)
 
             assert result is True
-            assert unload_entry.entry_id not in hass.data[DOMAIN]
+            assert unload_entry.entry_id not in hass.data[DOMAIN]["entries"]
 
     @pytest.mark.asyncio
     async def test_unload_entry_failure(self, hass, unload_entry):
         """Test failed unload keeps coordinator."""
         unload_entry.add_to_hass(hass)
         # Set up the data structure as if setup was called
-        hass.data[DOMAIN] = {unload_entry.entry_id: MagicMock()}
+        hass.data[DOMAIN] = {"entries": {unload_entry.entry_id: MagicMock()}}
 
         with patch.object(
             hass.config_entries, "async_unload_platforms", new=AsyncMock(return_value=False)
@@ -130,4 +223,4 @@ class TestIntegrationUnload:
 
             assert result is False
             # Coordinator should still be present on failure
-            assert unload_entry.entry_id in hass.data[DOMAIN]
+            assert unload_entry.entry_id in hass.data[DOMAIN]["entries"]
@@ -55,7 +55,7 @@ class TestNotification:
         data = {"message": "Hello World", "title": "Alert", "duration": 5, "icon": "mdi:test"}
 
         with (
-            patch("time.time", return_value=1000),
+            patch("time.monotonic", return_value=1000),
             patch.object(hass.loop, "call_later") as mock_call_later,
         ):
             await coordinator.trigger_notification(data)
@@ -65,6 +65,26 @@ class TestNotification:
             assert coordinator.async_request_refresh.called
             mock_call_later.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_clear_notification_refreshes_only_when_drawn(
+        self, hass, coordinator_device, options
+    ):
+        """Test clearing a notification only refreshes if it was rendered."""
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
+        coordinator.async_request_refresh = AsyncMock()
+        coordinator._notification_data = {"message": "Hidden"}
+
+        coordinator._clear_notification()
+        await hass.async_block_till_done()
+        assert not coordinator.async_request_refresh.called
+        assert coordinator._notification_data is None
+
+        coordinator._notification_data = {"message": "Shown"}
+        coordinator._notification_drawn = True
+        coordinator._clear_notification()
+        await hass.async_block_till_done()
+        assert coordinator.async_request_refresh.called
+
     @pytest.mark.asyncio
     async def test_notification_layout_creation(self, hass, coordinator_device, options):
         """Test notification layout is created correctly (HeroSimpleLayout)."""
@@ -148,6 +168,7 @@ class TestNotification:
         # Setup active notification
         coordinator._notification_data = {"message": "Active"}
         coordinator._notification_expiry = 2000
+        coordinator._tick_now = 1000
 
         # Mock renderer methods to avoid actual PIL calls
         coordinator.renderer.create_canvas = MagicMock(return_value=(MagicMock(), MagicMock()))
@@ -157,14 +178,11 @@ class TestNotification:
         # Build widget states mock
         coordinator._build_widget_states = MagicMock(return_value={})
 
-        with (
-            patch("time.time", return_value=1000),
-            patch.object(
-                coordinator,
-                "_create_notification_layout",
-                wraps=coordinator._create_notification_layout,
-            ) as mock_create,
-        ):
+        with patch.object(
+            coordinator,
+            "_create_notification_layout",
+            wraps=coordinator._create_notification_layout,
+        ) as mock_create:
             coordinator._render_display()
             mock_create.assert_called_once()
 
@@ -176,6 +194,7 @@ class TestNotification:
         # Setup expired notification
         coordinator._notification_data = {"message": "Expired"}
         coordinator._notification_expiry = 900
+        coordinator._tick_now = 1000
 
         # Mock renderer methods
         coordinator.renderer.create_canvas = MagicMock(return_value=(MagicMock(), MagicMock()))
@@ -183,13 +202,10 @@ class TestNotification:
         coordinator.renderer.to_png = MagicMock(return_value=b"png")
         coordinator._build_widget_states = MagicMock(return_value={})
 
-        with (
-            patch("time.time", return_value=1000),
-            patch.object(
-                coordinator,
-                "_create_notification_layout",
-                wraps=coordinator._create_notification_layout,
-            ) as mock_create,
-        ):
+        with patch.object(
+            coordinator,
+            "_create_notification_layout",
+            wraps=coordinator._create_notification_layout,
+        ) as mock_create:
             coordinator._render_display()
             mock_create.assert_not_called()
@@ -50,6 +50,31 @@ class TestRenderer:
 
         assert img.getpixel((0, 0)) == bg_color
 
+    def test_reusable_canvas_is_cleared_between_calls(self):
+        """Test the persistent canvas is reused and reset to the background."""
+        renderer = Renderer()
+        img, draw = renderer.get_reusable_canvas()
+        draw.rectangle((0, 0, 10, 10), fill=COLOR_WHITE)
+
+        img2, draw2 = renderer.get_reusable_canvas(background=COLOR_CYAN)
+
+        assert img2 is img
+        assert draw2 is draw
+        assert img.getpixel((0, 0)) == COLOR_CYAN
+
+    def test_draw_image_reuses_resized_source(self):
+        """Test drawing the same image at the same size resizes it only once."""
+        renderer = Renderer()
+        _img, draw = renderer.create_canvas()
+        source = Image.new("RGB", (64, 32), COLOR_CYAN)
+
+        renderer.draw_image(draw, source, (0, 0, 100, 100))
+        resized = renderer._resize_image(source, (200, 100))
+        renderer.draw_image(draw, source, (0, 0, 100, 100))
+
+        assert renderer._resize_image(source, (200, 100)) is resized
+        assert renderer._resize_image(source.copy(), (200, 100)) is not resized
+
     def test_finalize_downscales(self):
         """Test that finalize downscales to display resolution."""
         renderer = Renderer()